@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+"""
+Sometimes we need the distance between *every* pair of vertices, for
+instance to find the vertex most central to all of the others. For a
+graph with a few thousand vertices the answer is a matrix of millions of
+distances, and it is worth computing it carefully.
+
+The simplest approach is to run Dijkstra’s algorithm once from each
+vertex. These runs are independent of one another, so they can be shared
+between processes. Rather than return each row of distances as a
+dictionary, which would have to be pickled and sent back to the main
+process, every process writes its rows directly into a single matrix of
+$$V^2$$ floating point numbers in **shared memory**, created with
+`multiprocessing.RawArray`. The graph itself is converted to a
+`CSRGraph` and handed to each process, along with the matrix, once when
+it starts; from then on each process needs only to be told which
+sources to start from. Working with the CSR arrays also lets each search
+refer to vertices by number, using `distances_from`, so each row is
+simply a list of $$V$$ distances.
+
+The result is a `DistanceMatrix`, which stores the matrix as one flat
+sequence of distances, row after row, and looks up the row and column of
+each vertex by label.
+"""
+
+from array import array
+from multiprocessing import Pool, RawArray, cpu_count
+
+from csr_graph import CSRGraph, distances_from
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class DistanceMatrix(object):
+    def __init__(self, vertices, values):
+        self.vertices = vertices
+        self.values = values
+        self.index = {vertex: i for i, vertex in enumerate(vertices)}
+
+    def __len__(self):
+        return len(self.vertices)
+
+    def distance(self, a, b):
+        return self.values[self.index[a] * len(self) + self.index[b]]
+
+    def row(self, vertex):
+        start = self.index[vertex] * len(self)
+        return dict(zip(self.vertices,
+                        self.values[start:start + len(self)]))
+
+
+def all_pairs_shortest_paths(graph, processes=None, method=None):
+    if not isinstance(graph, CSRGraph):
+        graph = CSRGraph.from_dict(graph)
+    vertex_count = len(graph)
+    vertices = [graph.vertex(i) for i in range(vertex_count)]
+    if method is None:
+        dense = 16 * graph.edge_count() >= vertex_count * vertex_count
+        method = 'floyd_warshall' if numpy is not None and dense \
+            else 'dijkstra'
+    if method == 'floyd_warshall':
+        return DistanceMatrix(vertices, floyd_warshall(graph))
+    if method != 'dijkstra':
+        raise ValueError('unknown method {!r}'.format(method))
+
+    matrix = RawArray('d', vertex_count * vertex_count)
+    shared = (graph.offsets, graph.targets, graph.weights, matrix)
+    if processes == 1:
+        share_graph(*shared)
+        try:
+            fill_rows((0, vertex_count))
+        finally:
+            # don't keep the graph and matrix alive once we are done
+            share_graph(None, None, None, None)
+    else:
+        chunk_size = vertex_count // (4 * (processes or cpu_count())) + 1
+        pool = Pool(processes, share_graph, shared)
+        try:
+            tasks = [(start, min(start + chunk_size, vertex_count))
+                     for start in range(0, vertex_count, chunk_size)]
+            for _ in pool.imap_unordered(fill_rows, tasks):
+                pass
+        except BaseException:
+            pool.terminate()
+            raise
+        else:
+            pool.close()
+        finally:
+            pool.join()
+    return DistanceMatrix(vertices, matrix)
+
+
+shared_graph = None
+
+
+def share_graph(offsets, targets, weights, matrix):
+    global shared_graph
+    shared_graph = offsets, targets, weights, matrix
+
+
+def fill_rows(task):
+    start, end = task
+    offsets, targets, weights, matrix = shared_graph
+    graph = CSRGraph(offsets, targets, weights)
+    vertex_count = len(graph)
+    for source in range(start, end):
+        matrix[source * vertex_count:(source + 1) * vertex_count] = \
+            distances_from(graph, source)
+    return end - start
+
+"""
+The Floyd–Warshall Algorithm
+---
+
+On a dense graph, where $$E$$ approaches $$V^2$$, running Dijkstra’s
+algorithm from every vertex takes $$O(V^3 \log{V})$$ time, and the much
+simpler **Floyd–Warshall** algorithm does better. It starts with a
+matrix holding the weight of each edge, and then considers each vertex
+$$k$$ in turn as a possible stepping stone: for every pair of vertices
+$$i$$ and $$j$$, if going from $$i$$ to $$k$$ and then from $$k$$ to
+$$j$$ is shorter than the best route found so far, that becomes the new
+best route. After every vertex has been considered, the matrix holds
+the shortest distances. That is $$O(V^3)$$ steps, but each is a single
+addition and comparison.
+
+Better still, each round is the same operation applied to the whole
+matrix at once: the new matrix is the element-wise minimum of the old
+one and the sum of its column $$k$$ and its row $$k$$. With NumPy, that
+is one line which runs at the speed of compiled code. NumPy is not part
+of the standard library, so when it is not installed we fall back to
+doing the same thing one row at a time in plain Python, which is only
+practical for a few hundred vertices. By default,
+`all_pairs_shortest_paths` chooses Floyd–Warshall only when NumPy is
+available and the graph is dense; pass `method='floyd_warshall'` or
+`method='dijkstra'` to choose for yourself.
+"""
+
+
+def floyd_warshall(graph):
+    vertex_count = len(graph)
+    infinity = float('infinity')
+    if numpy is not None:
+        distances = numpy.full((vertex_count, vertex_count), infinity)
+        for i in range(vertex_count):
+            for j, weight in zip(graph.neighbor_ids(i),
+                                 graph.edge_weights(i)):
+                distances[i, j] = min(distances[i, j], weight)
+        numpy.fill_diagonal(distances, 0)
+        for k in range(vertex_count):
+            numpy.minimum(distances, distances[:, k, None] + distances[k],
+                          out=distances)
+        return distances.ravel()
+
+    rows = [[infinity] * vertex_count for _ in range(vertex_count)]
+    for i in range(vertex_count):
+        row = rows[i]
+        for j, weight in zip(graph.neighbor_ids(i), graph.edge_weights(i)):
+            row[j] = min(row[j], weight)
+        row[i] = 0
+    for k in range(vertex_count):
+        row_k = rows[k]
+        for i in range(vertex_count):
+            via_k = rows[i][k]
+            if via_k != infinity:
+                rows[i] = [min(distance, via_k + step)
+                           for distance, step in zip(rows[i], row_k)]
+    return array('d', (distance for row in rows for distance in row))
+
+# distances = all_pairs_shortest_paths(example_graph)
+# distances.distance('U', 'Z')  # => 3.0
+# distances.row('Z')
+# => {'U': 3.0, 'V': 4.0, 'W': 2.0, 'X': 2.0, 'Y': 1.0, 'Z': 0.0}
@@ -0,0 +1,61 @@
+import unittest
+
+import all_pairs_shortest_paths as all_pairs_module
+from all_pairs_shortest_paths import (
+    DistanceMatrix, all_pairs_shortest_paths, floyd_warshall, numpy)
+from csr_graph import CSRGraph
+from dijkstras_algorithm import calculate_distances, example_graph
+from random_graphs import random_digraph
+
+
+class TestCorrectness(unittest.TestCase):
+
+    def assert_matches_dijkstra(self, graph, matrix):
+        self.assertEqual(set(matrix.vertices), set(graph))
+        for source in graph:
+            self.assertEqual(matrix.row(source),
+                             calculate_distances(graph, source))
+
+    def test_example_graph(self):
+        for method in ('dijkstra', 'floyd_warshall'):
+            matrix = all_pairs_shortest_paths(example_graph, 1, method)
+            self.assertEqual(len(matrix), 6)
+            self.assertEqual(matrix.distance('U', 'Z'), 3)
+            self.assert_matches_dijkstra(example_graph, matrix)
+
+    def test_random_directed_graph(self):
+        graph = random_digraph(60, 200)
+        for method in ('dijkstra', 'floyd_warshall'):
+            matrix = all_pairs_shortest_paths(graph, 1, method)
+            self.assert_matches_dijkstra(graph, matrix)
+
+    def test_releases_shared_graph(self):
+        all_pairs_shortest_paths(example_graph, 1, 'dijkstra')
+        self.assertEqual(all_pairs_module.shared_graph,
+                         (None, None, None, None))
+
+    def test_in_parallel(self):
+        graph = random_digraph(80, 400, seed=1)
+        matrix = all_pairs_shortest_paths(graph, 2, 'dijkstra')
+        self.assert_matches_dijkstra(graph, matrix)
+
+    def test_floyd_warshall_on_csr_graph(self):
+        graph = CSRGraph.from_dict(random_digraph(30, 100, seed=2))
+        distances = floyd_warshall(graph)
+        matrix = DistanceMatrix(list(range(30)), list(distances))
+        self.assert_matches_dijkstra(graph.to_dict(), matrix)
+
+    def test_unknown_method(self):
+        self.assertRaises(ValueError, all_pairs_shortest_paths,
+                          example_graph, 1, 'bellman_ford')
+
+    @unittest.skipIf(numpy is None, 'NumPy is not installed')
+    def test_dense_graphs_use_numpy(self):
+        graph = random_digraph(40, 1000, seed=3)
+        matrix = all_pairs_shortest_paths(graph, 1)
+        self.assertIsInstance(matrix.values, numpy.ndarray)
+        self.assert_matches_dijkstra(graph, matrix)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,376 @@
+"""
+Benchmarks comparing the alternative implementations in this chapter.
+
+Run every benchmark with `python benchmarks.py`, or name the ones to run,
+as in `python benchmarks.py decrease_key`.
+"""
+
+from array import array
+from multiprocessing import cpu_count
+import random
+import sys
+import time
+
+from all_pairs_shortest_paths import all_pairs_shortest_paths, numpy
+from csr_graph import CSRGraph, distances_from
+from dijkstras_algorithm import (
+    bidirectional_shortest_path, calculate_distances,
+    calculate_distances_with_buckets, calculate_distances_with_decrease_key,
+    calculate_shortest_path_tree, shortest_path)
+from disjoint_set import DisjointSet
+from dynamic_shortest_paths import DynamicShortestPaths
+from knights_tour import (
+    find_solution_for, find_solution_with_bitboard, warnsdorffs_heuristic)
+from knights_tour_enumeration import count_tours, enumerate_tours
+from minimum_spanning_forest import boruvkas_algorithm, kruskals_algorithm
+from prims_spanning_tree import (
+    create_spanning_tree, create_spanning_tree_with_decrease_key)
+from random_graphs import random_dag, random_graph
+from strongly_connected_components import (
+    kosarajus_algorithm, tarjans_algorithm)
+from topological_sort import (
+    IncrementalTopologicalOrder, kahns_topological_sort, topological_sort)
+from word_ladder import (
+    BucketGraph, bidirectional_search, breadth_first_tree, build_graph,
+    build_graph_in_parallel, path_to, traverse)
+
+
+def grid_graph(size, max_weight=10, seed=0):
+    # a size by size grid, with an edge in each direction between
+    # horizontally and vertically adjacent squares
+    rng = random.Random(seed)
+    graph = {(row, col): {} for row in range(size) for col in range(size)}
+    for row in range(size):
+        for col in range(size):
+            for neighbor in ((row + 1, col), (row, col + 1)):
+                if neighbor in graph:
+                    weight = rng.randint(1, max_weight)
+                    graph[row, col][neighbor] = weight
+                    graph[neighbor][row, col] = weight
+    return graph
+
+
+def random_words(count, lengths=(5, 6), alphabet='abcdefghij', seed=0):
+    rng = random.Random(seed)
+    words = set()
+    while len(words) < count:
+        length = rng.choice(lengths)
+        words.add(''.join(rng.choice(alphabet) for _ in range(length)))
+    return sorted(words)
+
+
+def best_time(function, *args, **kwargs):
+    repeat = kwargs.pop('repeat', 3)
+    timings = []
+    for _ in range(repeat):
+        start = time.time()
+        function(*args)
+        timings.append(time.time() - start)
+    return min(timings)
+
+
+def report(label, seconds):
+    print('{:<48} {:>9.3f}s'.format(label, seconds))
+
+
+def benchmark_buckets():
+    for size, max_weight in ((300, 10), (700, 10), (700, 100)):
+        graph = grid_graph(size, max_weight)
+        print('{0}x{0} grid, weights 1 to {1}'.format(size, max_weight))
+        report('  calculate_distances (heapq)',
+               best_time(calculate_distances, graph, (0, 0)))
+        report('  calculate_distances_with_buckets',
+               best_time(calculate_distances_with_buckets, graph, (0, 0)))
+        report('  calculate_distances_with_buckets(max_weight=C)',
+               best_time(calculate_distances_with_buckets, graph, (0, 0),
+                         max_weight))
+
+
+def benchmark_csr_graph():
+    vertex_count, edge_count = 10 ** 5, 4 * 10 ** 5
+    graph = random_graph(vertex_count, edge_count)
+    csr = CSRGraph.from_dict(graph)
+    print('V={} E={}'.format(vertex_count, edge_count))
+    report('  calculate_distances (dict)',
+           best_time(calculate_distances, graph, 0))
+    report('  calculate_distances (CSRGraph views)',
+           best_time(calculate_distances, csr, 0))
+    report('  distances_from (CSRGraph ids)',
+           best_time(distances_from, csr, 0))
+
+
+def benchmark_decrease_key():
+    for vertex_count, edge_count in ((10 ** 4, 10 ** 5), (10 ** 5, 10 ** 6)):
+        graph = random_graph(vertex_count, edge_count)
+        print('V={} E={}'.format(vertex_count, edge_count))
+        report('  calculate_distances (lazy deletion)',
+               best_time(calculate_distances, graph, 0))
+        report('  calculate_distances_with_decrease_key',
+               best_time(calculate_distances_with_decrease_key, graph, 0))
+
+
+def benchmark_dynamic_shortest_paths(update_count=1000):
+    vertex_count, edge_count = 10 ** 5, 4 * 10 ** 5
+    graph = random_graph(vertex_count, edge_count)
+    rng = random.Random(1)
+    updates = []
+    for _ in range(update_count):
+        a = rng.randrange(vertex_count)
+        b = rng.choice(list(graph[a]))
+        updates.append((a, b, rng.randint(1, 100)))
+
+    paths = DynamicShortestPaths(graph, 0)
+
+    def update_all():
+        for a, b, weight in updates:
+            paths.set_weight(a, b, weight)
+            paths.set_weight(b, a, weight)
+
+    print('{} updates, V={} E={}'.format(update_count, vertex_count,
+                                         edge_count))
+    report('  calculate_distances',
+           best_time(calculate_distances, graph, 0, repeat=1))
+    report('  DynamicShortestPaths, all updates',
+           best_time(update_all, repeat=1))
+
+
+def benchmark_multiple_sources(source_count=20):
+    graph = random_graph(10 ** 5, 4 * 10 ** 5)
+    sources = random.Random(1).sample(range(10 ** 5), source_count)
+
+    def run_separately():
+        for source in sources:
+            calculate_distances(graph, source)
+
+    print('{} sources, V={} E={}'.format(source_count, 10 ** 5, 4 * 10 ** 5))
+    report('  calculate_distances from each source',
+           best_time(run_separately, repeat=1))
+    report('  calculate_shortest_path_tree',
+           best_time(calculate_shortest_path_tree, graph, sources))
+    report('  calculate_shortest_path_tree, radius=50',
+           best_time(calculate_shortest_path_tree, graph, sources, 50))
+
+
+def benchmark_single_target(query_count=20):
+    graph = random_graph(10 ** 5, 4 * 10 ** 5)
+    rng = random.Random(1)
+    queries = [(rng.randrange(10 ** 5), rng.randrange(10 ** 5))
+               for _ in range(query_count)]
+
+    def run(find_path):
+        for source, target in queries:
+            find_path(graph, source, target)
+
+    def run_full_search(graph, source, target):
+        calculate_distances(graph, source)[target]
+
+    print('{} queries, V={} E={}'.format(query_count, 10 ** 5, 4 * 10 ** 5))
+    for label, find_path in (('calculate_distances', run_full_search),
+                             ('shortest_path', shortest_path),
+                             ('bidirectional_shortest_path',
+                              bidirectional_shortest_path)):
+        report('  ' + label, best_time(run, find_path, repeat=1) / query_count)
+
+
+def benchmark_word_ladder_search(query_count=20):
+    words = random_words(10 ** 5)
+    graph = build_graph(words)
+    rng = random.Random(1)
+    queries = []
+    while len(queries) < query_count:
+        start, goal = rng.choice(words), rng.choice(words)
+        if len(start) == len(goal):
+            queries.append((start, goal))
+
+    def run_traverse(graph, start, goal):
+        for vertex, path in traverse(graph, start):
+            if vertex == goal:
+                return path
+
+    def run_breadth_first_tree(graph, start, goal):
+        return path_to(breadth_first_tree(graph, start, goal), goal)
+
+    def run(find_path):
+        for start, goal in queries:
+            find_path(graph, start, goal)
+
+    print('{} queries, {} words'.format(query_count, len(words)))
+    for label, find_path in (('traverse', run_traverse),
+                             ('breadth_first_tree', run_breadth_first_tree),
+                             ('bidirectional_search', bidirectional_search)):
+        report('  ' + label, best_time(run, find_path, repeat=1) / query_count)
+
+
+def benchmark_all_pairs():
+    for vertex_count, edge_count in ((300, 3000), (300, 30000),
+                                     (2000, 20000)):
+        graph = random_graph(vertex_count, edge_count)
+        print('V={} E={}, numpy {}'.format(
+            vertex_count, edge_count,
+            'available' if numpy is not None else 'not installed'))
+        for processes in sorted(set([1, cpu_count()])):
+            report('  dijkstra, {} processes'.format(processes),
+                   best_time(all_pairs_shortest_paths, graph, processes,
+                             'dijkstra', repeat=1))
+        if vertex_count <= 300 or numpy is not None:
+            report('  floyd_warshall', best_time(
+                all_pairs_shortest_paths, graph, 1, 'floyd_warshall',
+                repeat=1))
+
+
+def benchmark_bucket_graph():
+    for label, words in (
+            ('10^5 words of 5-6 letters', random_words(10 ** 5)),
+            ('1.5x10^5 words of 4 letters',
+             random_words(150000, (4,), 'abcdefghijklmnopqrstuvwxyz'))):
+        print(label)
+        report('  build_graph', best_time(build_graph, words, repeat=1))
+        report('  BucketGraph', best_time(BucketGraph, words, repeat=1))
+        graph = BucketGraph(words)
+        report('  breadth_first_tree over BucketGraph',
+               best_time(breadth_first_tree, graph, words[0], repeat=1))
+        graph = build_graph(words)
+        report('  breadth_first_tree over build_graph',
+               best_time(breadth_first_tree, graph, words[0], repeat=1))
+
+
+def benchmark_parallel_build():
+    words = random_words(2 * 10 ** 5, (4, 5, 6), 'abcdefghijklmnop')
+    print('{} words, {} cpus'.format(len(words), cpu_count()))
+    report('  build_graph', best_time(build_graph, words, repeat=1))
+    for processes in (1, 2, 4):
+        report('  build_graph_in_parallel, {} processes'.format(processes),
+               best_time(build_graph_in_parallel, words, processes, repeat=1))
+
+
+def benchmark_knights_tour():
+    report('find_solution_for, 5x5',
+           best_time(find_solution_for, 5, repeat=1))
+    report('find_solution_with_bitboard, 5x5, no heuristic',
+           best_time(find_solution_with_bitboard, 5, False))
+    report('find_solution_for, 8x8, warnsdorffs_heuristic',
+           best_time(find_solution_for, 8, warnsdorffs_heuristic))
+    for board_size in (8, 16, 32):
+        report('find_solution_with_bitboard, {0}x{0}'.format(board_size),
+               best_time(find_solution_with_bitboard, board_size))
+
+
+def benchmark_tour_enumeration():
+    def count_without_symmetry(board_size):
+        return sum(1 for _ in enumerate_tours(board_size, use_symmetry=False))
+
+    report('count_tours, 5x5, without symmetry',
+           best_time(count_without_symmetry, 5))
+    report('count_tours, 5x5', best_time(count_tours, 5))
+    report('count_tours, 6x6, closed',
+           best_time(count_tours, 6, True, repeat=1))
+
+
+def benchmark_disjoint_set():
+    # n random unions followed by n finds; if the time per operation is
+    # nearly constant, each total grows roughly tenfold with n
+    rng = random.Random(0)
+    for size in (10 ** 5, 10 ** 6, 10 ** 7):
+        sources = array('l', (rng.randrange(size) for _ in range(size)))
+        targets = array('l', (rng.randrange(size) for _ in range(size)))
+        components = DisjointSet(size)
+
+        def find_all():
+            for item in sources:
+                components.find(item)
+
+        print('n={}'.format(size))
+        report('  union_edges, n unions', best_time(
+            components.union_edges, sources, targets, repeat=1))
+        report('  find, n finds', best_time(find_all, repeat=1))
+
+
+def benchmark_prims_decrease_key():
+    for vertex_count, edge_count in ((10 ** 4, 10 ** 6),
+                                     (10 ** 4, 2 * 10 ** 6)):
+        graph = random_graph(vertex_count, edge_count)
+        print('V={} E={}'.format(vertex_count, edge_count))
+        report('  create_spanning_tree (lazy)',
+               best_time(create_spanning_tree, graph, 0))
+        report('  create_spanning_tree_with_decrease_key',
+               best_time(create_spanning_tree_with_decrease_key, graph, 0))
+
+
+def benchmark_spanning_tree():
+    for vertex_count, edge_count in ((10 ** 5, 2 * 10 ** 5),
+                                     (10 ** 5, 10 ** 6),
+                                     (2000, 10 ** 6)):
+        graph = random_graph(vertex_count, edge_count)
+        print('V={} E={}'.format(vertex_count, edge_count))
+        report('  create_spanning_tree (Prim)',
+               best_time(create_spanning_tree, graph, 0, repeat=1))
+        report('  kruskals_algorithm',
+               best_time(kruskals_algorithm, graph, repeat=1))
+        for processes in sorted(set([1, cpu_count()])):
+            report('  boruvkas_algorithm, {} processes'.format(processes),
+                   best_time(boruvkas_algorithm, graph, processes, repeat=1))
+
+
+def benchmark_strongly_connected_components():
+    vertex_count, edge_count = 10 ** 6, 2 * 10 ** 6
+    rng = random.Random(0)
+    graph = {vertex: [] for vertex in range(vertex_count)}
+    for _ in range(edge_count):
+        graph[rng.randrange(vertex_count)].append(rng.randrange(vertex_count))
+    print('V={} E={}'.format(vertex_count, edge_count))
+    report('  kosarajus_algorithm',
+           best_time(kosarajus_algorithm, graph, repeat=1))
+    report('  tarjans_algorithm',
+           best_time(tarjans_algorithm, graph, repeat=1))
+
+
+def benchmark_topological_sort(insertion_count=100):
+    vertex_count = 10 ** 6
+    graph, labels = random_dag(vertex_count, 2 * vertex_count)
+    print('V={} E={}'.format(vertex_count, 2 * vertex_count))
+    report('  topological_sort',
+           best_time(topological_sort, graph, repeat=1))
+    report('  kahns_topological_sort',
+           best_time(lambda graph: list(kahns_topological_sort(graph)),
+                     graph, repeat=1))
+
+    order = IncrementalTopologicalOrder(graph)
+    rng = random.Random(1)
+    insertions = []
+    while len(insertions) < insertion_count:
+        a = rng.randrange(vertex_count - 100)
+        insertions.append((labels[a], labels[a + rng.randint(1, 100)]))
+
+    def insert_all():
+        for u, v in insertions:
+            order.add_edge(u, v)
+
+    report('  IncrementalTopologicalOrder.add_edge',
+           best_time(insert_all, repeat=1) / insertion_count)
+
+
+BENCHMARKS = {
+    'all_pairs': benchmark_all_pairs,
+    'bucket_graph': benchmark_bucket_graph,
+    'buckets': benchmark_buckets,
+    'csr_graph': benchmark_csr_graph,
+    'decrease_key': benchmark_decrease_key,
+    'disjoint_set': benchmark_disjoint_set,
+    'dynamic_shortest_paths': benchmark_dynamic_shortest_paths,
+    'knights_tour': benchmark_knights_tour,
+    'multiple_sources': benchmark_multiple_sources,
+    'parallel_build': benchmark_parallel_build,
+    'prims_decrease_key': benchmark_prims_decrease_key,
+    'single_target': benchmark_single_target,
+    'spanning_tree': benchmark_spanning_tree,
+    'strongly_connected_components': benchmark_strongly_connected_components,
+    'topological_sort': benchmark_topological_sort,
+    'tour_enumeration': benchmark_tour_enumeration,
+    'word_ladder_search': benchmark_word_ladder_search,
+}
+
+
+if __name__ == '__main__':
+    for name in sys.argv[1:] or sorted(BENCHMARKS):
+        print('== {}'.format(name))
+        BENCHMARKS[name]()
@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+"""
+Dictionaries of dictionaries (or of sets) make it easy to write graph
+algorithms, but every edge costs a hash table entry, a key object and a
+value object, which adds up to hundreds of bytes per edge. For graphs
+with millions of edges a more compact representation is worthwhile.
+
+The **compressed sparse row** (**CSR**) representation numbers the
+vertices from $$0$$ to $$V - 1$$ and stores the whole graph in three flat
+arrays. `targets` holds the neighbors of vertex 0, followed by the
+neighbors of vertex 1, and so on; `weights` holds the weight of each of
+those edges in the same order; and `offsets` holds, for each vertex, the
+position in `targets` at which its neighbors begin, with one extra entry
+at the end. The neighbors of vertex `i` are therefore
+`targets[offsets[i]:offsets[i + 1]]`. Using Python’s `array` module each
+edge costs 16 bytes, and since arrays support the buffer protocol they
+can be handed to NumPy without copying.
+
+A `CSRGraph` also keeps a list of the original vertex labels, so that it
+can be indexed just like the dictionaries we have been using:
+`graph[vertex]` returns a lightweight view of the neighbors of `vertex`
+supporting iteration, `items()`, `len`, `in` and set difference. This
+means that the algorithms of later sections, such as
+`calculate_distances`, `create_spanning_tree`, `depth_first_search` and
+the word ladder `traverse`, can all be given a `CSRGraph` in place of a
+dictionary. Graphs built directly from arrays of integer edges with
+`from_edges` need no labels at all; their vertices are simply the
+integers $$0$$ to $$V - 1$$.
+"""
+
+from array import array
+from bisect import bisect_left
+import heapq
+from numbers import Integral
+
+
+class CSRGraph(object):
+    def __init__(self, offsets, targets, weights=None, vertices=None):
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.vertices = vertices
+        self._ids = None
+
+    @classmethod
+    def from_dict(cls, graph):
+        vertices = list(graph)
+        ids = {vertex: i for i, vertex in enumerate(vertices)}
+        for vertex in list(vertices):
+            for neighbor in graph[vertex]:
+                if neighbor not in ids:
+                    ids[neighbor] = len(vertices)
+                    vertices.append(neighbor)
+
+        weight_values = [
+            weight for vertex in graph if hasattr(graph[vertex], 'items')
+            for weight in graph[vertex].values()]
+        weighted = any(hasattr(graph[vertex], 'items') for vertex in graph)
+        integral = all(
+            isinstance(weight, Integral) for weight in weight_values)
+
+        offsets = array('l', [0])
+        targets = array('l')
+        weights = array('l' if integral else 'd') if weighted else None
+        for vertex in vertices:
+            neighbors = graph[vertex] if vertex in graph else ()
+            if hasattr(neighbors, 'items'):
+                edges = sorted((ids[neighbor], weight)
+                               for neighbor, weight in neighbors.items())
+            else:
+                edges = sorted((ids[neighbor], 1) for neighbor in neighbors)
+            targets.extend(target for target, _ in edges)
+            if weighted:
+                weights.extend(weight for _, weight in edges)
+            offsets.append(len(targets))
+
+        csr = cls(offsets, targets, weights, vertices)
+        csr._ids = ids
+        return csr
+
+    @classmethod
+    def from_edges(cls, vertex_count, sources, targets, weights=None):
+        # a counting sort of the edges by source vertex
+        offsets = array('l', [0]) * (vertex_count + 1)
+        for source in sources:
+            offsets[source + 1] += 1
+        for i in range(vertex_count):
+            offsets[i + 1] += offsets[i]
+
+        positions = array('l', offsets)
+        sorted_targets = array('l', [0]) * len(targets)
+        sorted_weights = None
+        if weights is not None:
+            sorted_weights = array(
+                getattr(weights, 'typecode', 'd'), [0]) * len(weights)
+        for edge, source in enumerate(sources):
+            position = positions[source]
+            positions[source] += 1
+            sorted_targets[position] = targets[edge]
+            if weights is not None:
+                sorted_weights[position] = weights[edge]
+
+        # neighbors are kept in order of id so that we can binary search them
+        for i in range(vertex_count):
+            start, end = offsets[i], offsets[i + 1]
+            if end - start > 1:
+                order = sorted(range(start, end),
+                               key=sorted_targets.__getitem__)
+                sorted_targets[start:end] = array(
+                    'l', [sorted_targets[j] for j in order])
+                if sorted_weights is not None:
+                    sorted_weights[start:end] = array(
+                        sorted_weights.typecode,
+                        [sorted_weights[j] for j in order])
+
+        return cls(offsets, sorted_targets, sorted_weights)
+
+    def to_dict(self):
+        return {vertex: dict(self[vertex].items()) for vertex in self}
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __iter__(self):
+        if self.vertices is None:
+            return iter(range(len(self)))
+        return iter(self.vertices)
+
+    def __contains__(self, vertex):
+        try:
+            self.vertex_id(vertex)
+        except KeyError:
+            return False
+        return True
+
+    def __getitem__(self, vertex):
+        i = self.vertex_id(vertex)
+        return CSRNeighbors(self, self.offsets[i], self.offsets[i + 1])
+
+    def edge_count(self):
+        return len(self.targets)
+
+    def vertex_id(self, vertex):
+        if self.vertices is None:
+            if isinstance(vertex, Integral) and 0 <= vertex < len(self):
+                return vertex
+            raise KeyError(vertex)
+        if self._ids is None:
+            self._ids = {label: i for i, label in enumerate(self.vertices)}
+        return self._ids[vertex]
+
+    def vertex(self, i):
+        if self.vertices is None:
+            return i
+        return self.vertices[i]
+
+    def neighbor_ids(self, i):
+        return self.targets[self.offsets[i]:self.offsets[i + 1]]
+
+    def edge_weights(self, i):
+        start, end = self.offsets[i], self.offsets[i + 1]
+        if self.weights is None:
+            return array('l', [1]) * (end - start)
+        return self.weights[start:end]
+
+
+class CSRNeighbors(object):
+    def __init__(self, graph, start, end):
+        self.graph = graph
+        self.start = start
+        self.end = end
+
+    def __len__(self):
+        return self.end - self.start
+
+    def __iter__(self):
+        targets = self.graph.targets[self.start:self.end]
+        vertices = self.graph.vertices
+        if vertices is None:
+            return iter(targets)
+        return (vertices[target] for target in targets)
+
+    def __contains__(self, vertex):
+        return self._position(vertex) is not None
+
+    def __getitem__(self, vertex):
+        position = self._position(vertex)
+        if position is None:
+            raise KeyError(vertex)
+        if self.graph.weights is None:
+            return 1
+        return self.graph.weights[position]
+
+    def __sub__(self, other):
+        return set(self).difference(other)
+
+    def keys(self):
+        return list(self)
+
+    def items(self):
+        if self.graph.weights is None:
+            return ((neighbor, 1) for neighbor in self)
+        weights = self.graph.weights[self.start:self.end]
+        if self.graph.vertices is None:
+            return zip(self.graph.targets[self.start:self.end], weights)
+        return zip(self, weights)
+
+    def _position(self, vertex):
+        try:
+            target = self.graph.vertex_id(vertex)
+        except KeyError:
+            return None
+        targets = self.graph.targets
+        position = bisect_left(targets, target, self.start, self.end)
+        if position < self.end and targets[position] == target:
+            return position
+        return None
+
+"""
+Convenient as the views are, each step through `graph[vertex].items()`
+looks up a label and builds a tuple for every edge, so `calculate_distances`
+on a `CSRGraph` is no faster than on a dictionary. Algorithms that can work
+with vertex ids instead should take the slices of `targets` and `weights`
+for each vertex directly, as `distances_from` does below. It is
+Dijkstra’s algorithm again, but with the distances kept in a list indexed
+by id, and each vertex’s edges read from `neighbor_ids` and
+`edge_weights`. `calculate_distances` wraps it up to return the same
+dictionary of labels as the version in the Dijkstra’s algorithm chapter.
+"""
+
+
+def distances_from(graph, source):
+    distances = [float('infinity')] * len(graph)
+    distances[source] = 0
+
+    pq = [(0, source)]
+    while pq:
+        current_distance, current = heapq.heappop(pq)
+        if current_distance > distances[current]:
+            continue
+        for neighbor, weight in zip(graph.neighbor_ids(current),
+                                    graph.edge_weights(current)):
+            distance = current_distance + weight
+            if distance < distances[neighbor]:
+                distances[neighbor] = distance
+                heapq.heappush(pq, (distance, neighbor))
+
+    return distances
+
+
+def calculate_distances(graph, starting_vertex):
+    distances = distances_from(graph, graph.vertex_id(starting_vertex))
+    return {graph.vertex(i): distance for i, distance in enumerate(distances)}
@@ -0,0 +1,86 @@
+import unittest
+from array import array
+
+from csr_graph import CSRGraph, distances_from
+from csr_graph import calculate_distances as calculate_csr_distances
+from depth_first_search import depth_first_search, simple_graph
+from dijkstras_algorithm import calculate_distances, example_graph
+from knights_tour import build_graph as build_knights_graph
+from prims_spanning_tree import create_spanning_tree
+from prims_spanning_tree import example_graph as prims_example_graph
+from word_ladder import traverse, word_graph
+
+
+class TestCorrectness(unittest.TestCase):
+
+    def test_round_trips_weighted_graph(self):
+        graph = CSRGraph.from_dict(example_graph)
+        self.assertEqual(len(graph), len(example_graph))
+        self.assertEqual(graph.edge_count(), 20)
+        self.assertEqual(graph.to_dict(), example_graph)
+        self.assertEqual(graph['W']['Y'], 1)
+        self.assertIn('Z', graph['Y'])
+        self.assertNotIn('U', graph['Y'])
+        self.assertNotIn('Q', graph)
+
+    def test_converts_unweighted_graphs(self):
+        knights_graph = build_knights_graph(5)
+        graph = CSRGraph.from_dict(knights_graph)
+        self.assertIsNone(graph.weights)
+        for vertex in knights_graph:
+            self.assertEqual(set(graph[vertex]), knights_graph[vertex])
+            self.assertEqual(graph[vertex] - set([(0, 0)]),
+                             knights_graph[vertex] - set([(0, 0)]))
+
+    def test_builds_from_edge_arrays(self):
+        sources = array('l', [2, 0, 1, 0, 2])
+        targets = array('l', [1, 2, 2, 1, 0])
+        weights = array('d', [5, 3, 1, 4, 2])
+        graph = CSRGraph.from_edges(3, sources, targets, weights)
+        self.assertEqual(list(graph.offsets), [0, 2, 3, 5])
+        self.assertEqual(list(graph.targets), [1, 2, 2, 0, 1])
+        self.assertEqual(list(graph.weights), [4, 3, 1, 2, 5])
+        self.assertEqual(graph.to_dict(), {
+            0: {1: 4, 2: 3}, 1: {2: 1}, 2: {0: 2, 1: 5}})
+
+    def test_algorithms_accept_csr_graphs(self):
+        self.assertEqual(
+            calculate_distances(CSRGraph.from_dict(example_graph), 'X'),
+            calculate_distances(example_graph, 'X'))
+        self.assertEqual(
+            create_spanning_tree(CSRGraph.from_dict(prims_example_graph), 'A'),
+            create_spanning_tree(prims_example_graph, 'A'))
+        self.assertEqual(
+            depth_first_search(CSRGraph.from_dict(simple_graph), 'A'),
+            depth_first_search(simple_graph, 'A'))
+
+        self.assertEqual(
+            [len(path) for _, path in
+             traverse(CSRGraph.from_dict(word_graph), 'FOOL')],
+            [len(path) for _, path in traverse(word_graph, 'FOOL')])
+
+    def test_calculates_distances_by_id(self):
+        graph = CSRGraph.from_dict(example_graph)
+        self.assertEqual(calculate_csr_distances(graph, 'X'),
+                         calculate_distances(example_graph, 'X'))
+        distances = distances_from(graph, graph.vertex_id('X'))
+        self.assertEqual(distances[graph.vertex_id('Z')], 2)
+
+        unweighted = CSRGraph.from_edges(
+            3, array('l', [0, 1]), array('l', [1, 2]))
+        self.assertEqual(distances_from(unweighted, 0), [0, 1, 2])
+        self.assertEqual(distances_from(unweighted, 2),
+                         [float('infinity'), float('infinity'), 0])
+
+    def test_accepts_any_integral_vertex_id(self):
+        graph = CSRGraph.from_edges(
+            2, array('l', [0]), array('l', [1]), array('l', [7]))
+        # a long in Python 2
+        one = (1 << 64) >> 64
+        self.assertIn(one, graph)
+        self.assertEqual(graph[0][one], 7)
+        self.assertNotIn(1.0, graph)
+
+
+if __name__ == '__main__':
+    unittest.main()
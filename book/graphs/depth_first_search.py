@@ -201,3 +201,141 @@ the **parenthesis property**. This property means that all the children
 of a particular node in the depth first tree have a later discovery time
 and an earlier finish time than their parent.
 """
+
+
+"""
+An Iterative Depth First Forest
+---
+
+Because `traverse` calls itself once for every vertex on the current
+path, a graph containing a long chain of vertices (a build pipeline of
+100,000 steps, say) quickly exceeds Python’s recursion limit. Storing a
+dictionary of times for each vertex is also rather extravagant for large
+graphs.
+
+`depth_first_forest` below makes the stack explicit. Each entry on the
+stack holds a vertex along with an *iterator* over its neighbors, so that
+when we return to a vertex we carry on from the neighbor after the one
+we last explored, just as the recursive version does when a call to
+`traverse` returns. If the neighbors of a vertex are exhausted, the
+`else` clause of the `for` loop finishes the vertex and pops it off the
+stack.
+
+The search continues from every vertex of the graph (or from each of the
+given `starting_vertices` in turn) that has not yet been discovered, so
+it builds the whole depth first forest. Vertices are numbered in the
+order they are discovered, and the discovery times, finish times and the
+parent of each vertex in the forest are kept in compact arrays indexed
+by those numbers, with a parent of `-1` marking the root of a tree.
+"""
+
+from array import array
+
+TREE_EDGE = 'tree'
+BACK_EDGE = 'back'
+FORWARD_EDGE = 'forward'
+CROSS_EDGE = 'cross'
+
+
+def depth_first_forest(graph, starting_vertices=None):
+    forest = DepthFirstForest(graph)
+    index = forest.index
+    counter = 0
+
+    for root in graph if starting_vertices is None else starting_vertices:
+        if root in index:
+            continue
+        counter += 1
+        stack = [(forest.discover(root, -1, counter),
+                  iter(graph[root] if root in graph else ()))]
+        while stack:
+            i, neighbors = stack[-1]
+            for neighbor in neighbors:
+                if neighbor not in index:
+                    counter += 1
+                    j = forest.discover(neighbor, i, counter)
+                    stack.append((j, iter(
+                        graph[neighbor] if neighbor in graph else ())))
+                    break
+            else:
+                stack.pop()
+                counter += 1
+                forest.finish[i] = counter
+
+    return forest
+
+
+class DepthFirstForest(object):
+    def __init__(self, graph):
+        self.graph = graph
+        self.vertices = []
+        self.index = {}
+        self.discovery = array('l')
+        self.finish = array('l')
+        self.parent = array('l')
+
+    def __len__(self):
+        return len(self.vertices)
+
+    def discover(self, vertex, parent, time):
+        i = len(self.vertices)
+        self.vertices.append(vertex)
+        self.index[vertex] = i
+        self.discovery.append(time)
+        self.finish.append(0)
+        self.parent.append(parent)
+        return i
+
+    def roots(self):
+        return [vertex for vertex, parent in zip(self.vertices, self.parent)
+                if parent == -1]
+
+    def traversal_times(self):
+        return {
+            vertex: {'discovery': self.discovery[i], 'finish': self.finish[i]}
+            for i, vertex in enumerate(self.vertices)
+        }
+
+    """
+The parenthesis property also tells us how each edge $$(u, v)$$ of the
+graph relates to the forest, without our having to record anything more
+during the search:
+
+-   a **tree edge** is one that the search followed, so $$u$$ is the
+    parent of $$v$$;
+-   a **back edge** leads from $$u$$ to one of its ancestors (or to
+    itself), so $$v$$ was discovered before and finished after $$u$$;
+-   a **forward edge** leads from $$u$$ to a descendant which the search
+    reached by some other route; and
+-   a **cross edge** leads to a vertex that is neither an ancestor nor a
+    descendant, in the same tree or an earlier one, which was finished
+    before $$u$$ was discovered.
+
+A directed graph has a cycle exactly when the search finds a back edge,
+which is what makes these classes so useful.
+"""
+
+    def edge_class(self, u, v):
+        i, j = self.index[u], self.index[v]
+        discovery, finish = self.discovery, self.finish
+        if self.parent[j] == i:
+            return TREE_EDGE
+        if discovery[j] <= discovery[i] and finish[i] <= finish[j]:
+            return BACK_EDGE
+        if discovery[i] < discovery[j] and finish[j] < finish[i]:
+            return FORWARD_EDGE
+        return CROSS_EDGE
+
+    def classified_edges(self):
+        for u in self.vertices:
+            if u in self.graph:
+                for v in self.graph[u]:
+                    yield u, v, self.edge_class(u, v)
+
+forest = depth_first_forest(simple_graph, ['A'])
+# forest.traversal_times() == traversal_times
+# sorted(forest.classified_edges())
+# =>
+# [('A', 'B', 'tree'), ('A', 'D', 'forward'), ('B', 'C', 'tree'),
+#  ('B', 'D', 'tree'), ('D', 'E', 'tree'), ('E', 'B', 'back'),
+#  ('E', 'F', 'tree'), ('F', 'C', 'cross')]
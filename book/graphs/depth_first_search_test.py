@@ -1,6 +1,8 @@
 import unittest
 
-from depth_first_search import traversal_times
+from depth_first_search import (
+    BACK_EDGE, CROSS_EDGE, FORWARD_EDGE, TREE_EDGE, depth_first_forest,
+    simple_graph, traversal_times)
 
 expected_traversal_times = {
     'A': {
@@ -35,5 +37,49 @@ class TestCorrectness(unittest.TestCase):
     def test_traverses_correctly(self):
         self.assertEqual(traversal_times, expected_traversal_times)
 
+    def test_iterative_forest_matches_recursive_search(self):
+        forest = depth_first_forest(simple_graph, ['A'])
+        self.assertEqual(forest.traversal_times(), expected_traversal_times)
+        self.assertEqual(forest.roots(), ['A'])
+        self.assertEqual(forest.vertices[forest.parent[forest.index['F']]],
+                         'E')
+
+    def test_classifies_edges(self):
+        forest = depth_first_forest(simple_graph, ['A'])
+        self.assertEqual(dict(((u, v), kind) for u, v, kind
+                              in forest.classified_edges()), {
+            ('A', 'B'): TREE_EDGE,
+            ('A', 'D'): FORWARD_EDGE,
+            ('B', 'C'): TREE_EDGE,
+            ('B', 'D'): TREE_EDGE,
+            ('D', 'E'): TREE_EDGE,
+            ('E', 'B'): BACK_EDGE,
+            ('E', 'F'): TREE_EDGE,
+            ('F', 'C'): CROSS_EDGE,
+        })
+
+    def test_forest_covers_every_vertex(self):
+        graph = {'A': ['B'], 'B': [], 'C': ['A', 'D'], 'D': ['D']}
+        forest = depth_first_forest(graph, ['A', 'B', 'C', 'D'])
+        self.assertEqual(forest.roots(), ['A', 'C'])
+        self.assertEqual(len(forest), 4)
+        self.assertEqual(forest.edge_class('C', 'A'), CROSS_EDGE)
+        self.assertEqual(forest.edge_class('D', 'D'), BACK_EDGE)
+        self.assertEqual(set(depth_first_forest(graph).vertices), set(graph))
+
+    def test_long_chain_does_not_overflow_the_stack(self):
+        length = 10 ** 5
+        graph = {i: [i + 1] for i in range(length)}
+        forest = depth_first_forest(graph, [0])
+        self.assertEqual(len(forest), length + 1)
+        self.assertEqual(forest.discovery[length], length + 1)
+        self.assertEqual(forest.finish[0], 2 * (length + 1))
+
+    def test_starts_from_sink_missing_from_graph(self):
+        graph = {'A': ['B']}
+        forest = depth_first_forest(graph, ['B', 'A'])
+        self.assertEqual(forest.roots(), ['B', 'A'])
+        self.assertEqual(forest.edge_class('A', 'B'), CROSS_EDGE)
+
 if __name__ == '__main__':
     unittest.main()
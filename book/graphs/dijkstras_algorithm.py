@@ -224,3 +224,435 @@ Finally, if we consider that each priority queue operation (adding or
 removing an entry) is $$O(\log E)$$, we conclude that the total running
 time is $$O(V + E \log E)$$.
 """
+
+"""
+Decreasing Keys Instead of Adding Entries
+---
+
+Adding a fresh entry every time we find a shorter path is simple, but on
+dense graphs it means that the priority queue can grow to hold $$O(E)$$
+entries, most of which are stale by the time they are removed. If we
+instead use an `IndexedPriorityQueue` (shown later in this chapter),
+which can locate a vertex that is already in the queue and lower its
+priority in place, the queue never holds more than one entry per vertex,
+so it stays at $$O(V)$$ entries and every entry we remove is one we
+actually need to process.
+"""
+
+from indexed_priority_queue import IndexedPriorityQueue
+
+
+def calculate_distances_with_decrease_key(graph, starting_vertex):
+    distances = {vertex: float('infinity') for vertex in graph}
+    distances[starting_vertex] = 0
+
+    pq = IndexedPriorityQueue()
+    pq.push(starting_vertex, 0)
+    while len(pq) > 0:
+        current_distance, current_vertex = pq.pop()
+
+        for neighbor, weight in graph[current_vertex].items():
+            distance = current_distance + weight
+
+            if distance < distances[neighbor]:
+                distances[neighbor] = distance
+                if neighbor in pq:
+                    pq.decrease_key(neighbor, distance)
+                else:
+                    pq.push(neighbor, distance)
+
+    return distances
+
+"""
+Since each vertex is now removed from the queue exactly once, there is
+no need for the stale entry check. A vertex that has already been removed
+can never be added again, because with non-negative weights we can never
+find a shorter path to a vertex after it has been removed.
+
+Both versions perform $$O(E)$$ priority queue updates, so which is faster
+in practice depends on the graph: the decrease key version keeps a
+smaller heap, but each update does more bookkeeping than a single call to
+`heapq.heappush`.
+"""
+
+"""
+Finding a Single Shortest Path
+---
+
+Very often we only care about the shortest path between two particular
+vertices, rather than about the distances to every vertex in the graph.
+Since Dijkstra’s algorithm removes vertices from the priority queue in
+order of their distance from the start, we know the shortest distance to
+our target as soon as it is removed from the queue, and can stop there.
+
+To recover the path itself, we keep a `predecessors` dictionary which
+records, for each vertex, the vertex from which we reached it along the
+best path found so far. Following these links back from the target, and
+reversing the result, gives us the path. Notice too that we no longer
+initialize `distances` with every vertex in the graph; a vertex that is
+missing from `distances` simply has not been reached yet, so a search
+which stops early never needs to touch the rest of the graph.
+"""
+
+
+def path_to(predecessors, vertex):
+    path = []
+    while vertex is not None:
+        path.append(vertex)
+        vertex = predecessors[vertex]
+    path.reverse()
+    return path
+
+
+def shortest_path(graph, starting_vertex, target_vertex):
+    distances = {starting_vertex: 0}
+    predecessors = {starting_vertex: None}
+
+    pq = [(0, starting_vertex)]
+    while len(pq) > 0:
+        current_distance, current_vertex = heapq.heappop(pq)
+        if current_distance > distances[current_vertex]:
+            continue
+        if current_vertex == target_vertex:
+            return current_distance, path_to(predecessors, target_vertex)
+
+        for neighbor, weight in graph[current_vertex].items():
+            distance = current_distance + weight
+            if distance < distances.get(neighbor, float('infinity')):
+                distances[neighbor] = distance
+                predecessors[neighbor] = current_vertex
+                heapq.heappush(pq, (distance, neighbor))
+
+    return float('infinity'), None
+
+# shortest_path(example_graph, 'U', 'Z')  # => (3, ['U', 'X', 'Y', 'Z'])
+
+"""
+We can do better still by searching from both ends at once. A
+**bidirectional search** runs one Dijkstra search forward from the start
+and another backward from the target, always advancing whichever of the
+two has the closer vertex at the front of its queue. Whenever either
+search examines an edge that leads to a vertex already reached by the
+other, we have found a complete path, and we remember the shortest such
+path in `best_distance`.
+
+We can stop once the sum of the distances at the front of the two queues
+is at least `best_distance`, since any path we have not yet found must
+be at least that long. Roughly speaking, each search only needs to
+explore a “ball” around its end with half the radius of the single
+search, which on large graphs means exploring far fewer vertices.
+
+The backward search must follow edges in reverse, so for a directed
+graph we need to pass in the graph with every edge reversed. For an
+undirected graph like `example_graph` the graph is its own reverse.
+"""
+
+
+def bidirectional_shortest_path(graph, starting_vertex, target_vertex,
+                                reverse_graph=None):
+    if reverse_graph is None:
+        reverse_graph = graph
+    if starting_vertex == target_vertex:
+        return 0, [starting_vertex]
+
+    forward_distances = {starting_vertex: 0}
+    forward_predecessors = {starting_vertex: None}
+    forward_pq = [(0, starting_vertex)]
+    backward_distances = {target_vertex: 0}
+    backward_predecessors = {target_vertex: None}
+    backward_pq = [(0, target_vertex)]
+
+    best_distance = float('infinity')
+    meeting_edge = None
+
+    while forward_pq and backward_pq:
+        if forward_pq[0][0] + backward_pq[0][0] >= best_distance:
+            break
+
+        searching_forward = forward_pq[0][0] <= backward_pq[0][0]
+        if searching_forward:
+            adjacent, pq = graph, forward_pq
+            distances, predecessors = forward_distances, forward_predecessors
+            other_distances = backward_distances
+        else:
+            adjacent, pq = reverse_graph, backward_pq
+            distances, predecessors = backward_distances, \
+                backward_predecessors
+            other_distances = forward_distances
+
+        current_distance, current_vertex = heapq.heappop(pq)
+        if current_distance > distances[current_vertex]:
+            continue
+
+        for neighbor, weight in adjacent[current_vertex].items():
+            distance = current_distance + weight
+            if distance < distances.get(neighbor, float('infinity')):
+                distances[neighbor] = distance
+                predecessors[neighbor] = current_vertex
+                heapq.heappush(pq, (distance, neighbor))
+
+            if neighbor in other_distances:
+                total = distance + other_distances[neighbor]
+                if total < best_distance:
+                    best_distance = total
+                    meeting_edge = (current_vertex, neighbor) \
+                        if searching_forward else (neighbor, current_vertex)
+
+    if meeting_edge is None:
+        return float('infinity'), None
+
+    # the forward half of the path runs from the start to one end of the
+    # meeting edge, and the backward half from its other end to the target
+    forward_vertex, backward_vertex = meeting_edge
+    path = path_to(forward_predecessors, forward_vertex)
+    path.extend(reversed(path_to(backward_predecessors, backward_vertex)))
+    return best_distance, path
+
+# bidirectional_shortest_path(example_graph, 'U', 'Z')
+# => (3, ['U', 'X', 'Y', 'Z'])
+
+"""
+A\* Search
+---
+
+Dijkstra’s algorithm explores outward from the start in every direction
+at once, even when we can tell that some directions lead away from our
+target. If we have some way of estimating the remaining distance from
+each vertex to the target, we can use it to steer the search. The **A\***
+algorithm does exactly this: rather than ordering the priority queue by
+the distance from the start alone, it orders it by that distance plus a
+`heuristic` estimate of the distance still to go.
+
+As long as the heuristic never overestimates the true remaining distance
+(in which case it is said to be **admissible**) and never decreases by
+more than the weight of an edge as we cross it (**consistent**), A\* will
+still find the shortest path, and each vertex will still be settled at
+most once. A heuristic that always returns zero turns A\* back into the
+`shortest_path` function above.
+
+The entries in our priority queue are now tuples of `(estimate,
+distance, vertex)`. To let us see how much work a heuristic saves, we
+also accept an optional `stats` dictionary in which we count the number
+of vertices settled and the number of entries added to the queue.
+"""
+
+import math
+
+
+def a_star_search(graph, starting_vertex, target_vertex, heuristic,
+                  stats=None):
+    if stats is None:
+        stats = {}
+    stats.setdefault('settled', 0)
+    stats.setdefault('pushed', 0)
+
+    distances = {starting_vertex: 0}
+    predecessors = {starting_vertex: None}
+
+    pq = [(heuristic(starting_vertex, target_vertex), 0, starting_vertex)]
+    stats['pushed'] += 1
+    while len(pq) > 0:
+        _, current_distance, current_vertex = heapq.heappop(pq)
+        if current_distance > distances[current_vertex]:
+            continue
+        stats['settled'] += 1
+        if current_vertex == target_vertex:
+            return current_distance, path_to(predecessors, target_vertex)
+
+        for neighbor, weight in graph[current_vertex].items():
+            distance = current_distance + weight
+            if distance < distances.get(neighbor, float('infinity')):
+                distances[neighbor] = distance
+                predecessors[neighbor] = current_vertex
+                estimate = distance + heuristic(neighbor, target_vertex)
+                heapq.heappush(pq, (estimate, distance, neighbor))
+                stats['pushed'] += 1
+
+    return float('infinity'), None
+
+"""
+Which heuristic to use depends on what we know about the vertices. When
+they are places with coordinates, such as the intersections of a road
+network, the straight-line distance between two places is a natural
+choice, since no route can be shorter than a straight line. On a grid
+where we can only move horizontally and vertically, the Manhattan
+distance is both admissible and a closer estimate. Both functions below
+take a dictionary mapping each vertex to its `(x, y)` coordinates and
+return a heuristic.
+
+For a word ladder, where each step changes exactly one letter, the number
+of letters that differ between a word and the target word is a lower
+bound on the number of steps remaining, so `hamming_distance` can be used
+as a heuristic directly.
+"""
+
+
+def euclidean_heuristic(coordinates):
+    def heuristic(vertex, target_vertex):
+        (x1, y1), (x2, y2) = coordinates[vertex], coordinates[target_vertex]
+        return math.hypot(x1 - x2, y1 - y2)
+
+    return heuristic
+
+
+def manhattan_heuristic(coordinates):
+    def heuristic(vertex, target_vertex):
+        (x1, y1), (x2, y2) = coordinates[vertex], coordinates[target_vertex]
+        return abs(x1 - x2) + abs(y1 - y2)
+
+    return heuristic
+
+
+def hamming_distance(word, target_word):
+    return sum(1 for a, b in zip(word, target_word) if a != b)
+
+# stats = {}
+# a_star_search(example_graph, 'U', 'Z', lambda vertex, target: 0, stats)
+# => (3, ['U', 'X', 'Y', 'Z'])
+# stats  # => {'settled': 6, 'pushed': 8}
+
+"""
+Shortest Path Trees and Multiple Sources
+---
+
+`calculate_distances` tells us how far away every vertex is, but not how
+to get there, so finding a route means searching all over again. Keeping
+the `predecessors` dictionary, as `shortest_path` does, costs almost
+nothing extra and gives us the whole **shortest path tree**: `path_to`
+can then recover the route to any vertex.
+
+Two more small changes make the search far more useful in practice. We
+can start from several sources at once by putting all of them in the
+priority queue at a distance of zero. The search then finds, for each
+vertex, the distance to the *nearest* source, in a single pass instead of
+one search per source; this is exactly what we need to find the closest
+hospital or warehouse to every address on a map. And we can give a
+`radius`, beyond which we do not bother to look: a vertex further than
+that from every source is never added to the queue, so the search only
+explores the neighborhood we care about.
+
+As in `shortest_path`, vertices that are not reached are simply missing
+from `distances`. Each source has a predecessor of `None`, so the first
+vertex of the path to any vertex is the source nearest to it, and
+`nearest_sources` works this out for every reached vertex at once.
+"""
+
+
+def calculate_shortest_path_tree(graph, sources, radius=None):
+    distances = {}
+    predecessors = {}
+    for source in sources:
+        distances[source] = 0
+        predecessors[source] = None
+    if radius is None:
+        radius = float('infinity')
+
+    pq = [(0, source) for source in distances]
+    while len(pq) > 0:
+        current_distance, current_vertex = heapq.heappop(pq)
+        if current_distance > distances[current_vertex]:
+            continue
+
+        for neighbor, weight in graph[current_vertex].items():
+            distance = current_distance + weight
+            if distance <= radius and \
+                    distance < distances.get(neighbor, float('infinity')):
+                distances[neighbor] = distance
+                predecessors[neighbor] = current_vertex
+                heapq.heappush(pq, (distance, neighbor))
+
+    return distances, predecessors
+
+
+def nearest_sources(predecessors):
+    nearest = {}
+    for vertex in predecessors:
+        path = []
+        while vertex not in nearest and predecessors[vertex] is not None:
+            path.append(vertex)
+            vertex = predecessors[vertex]
+        source = nearest.get(vertex, vertex)
+        nearest[vertex] = source
+        for step in path:
+            nearest[step] = source
+    return nearest
+
+# distances, predecessors = calculate_shortest_path_tree(
+#     example_graph, ['U', 'Z'], radius=2)
+# distances  # => {'U': 0, 'Z': 0, 'V': 2, 'X': 1, 'Y': 1, 'W': 2}
+# path_to(predecessors, 'W')  # => ['Z', 'Y', 'W']
+# nearest_sources(predecessors)['X']  # => 'U'
+
+"""
+Dial’s Algorithm
+---
+
+The weights in many graphs, including our `example_graph`, are small
+non-negative integers. Then there is a faster alternative to a binary
+heap, due to Robert Dial: keep a **bucket** (a plain list) for each
+possible distance, and work through the buckets in order of distance.
+Adding a vertex to a bucket and taking one out both take constant time,
+so the $$\log{V}$$ cost of each heap operation disappears.
+
+We need not keep a bucket for every distance, either. If the largest
+weight is $$C$$, then while we are working through the vertices at
+distance $$d$$, every distance we can discover lies between $$d$$ and
+$$d + C$$. So $$C + 1$$ buckets, reused in rotation, are enough: the
+vertices at distance $$d$$ live in bucket $$d \bmod (C + 1)$$. As in
+`calculate_distances`, a vertex may be added more than once, and we skip
+any entry whose distance has since improved.
+
+If `max_weight` is not given, we find it by looking at every weight in
+the graph, which also lets us check that they are all non-negative
+integers, raising a `ValueError` if not. A caller who knows the largest
+weight can pass it and skip that scan; any weight we then find to be
+larger than `max_weight` (or not a whole number) also raises a
+`ValueError`.
+"""
+
+
+def calculate_distances_with_buckets(graph, starting_vertex,
+                                     max_weight=None):
+    if max_weight is None:
+        max_weight = 0
+        for vertex in graph:
+            for _, weight in graph[vertex].items():
+                if weight < 0 or weight % 1:
+                    raise ValueError(
+                        'weight {!r} is not a non-negative integer'.format(
+                            weight))
+                if weight > max_weight:
+                    max_weight = weight
+    bucket_count = int(max_weight) + 1
+
+    distances = {vertex: float('infinity') for vertex in graph}
+    distances[starting_vertex] = 0
+    buckets = [[] for _ in range(bucket_count)]
+    buckets[0].append(starting_vertex)
+    pending = 1
+
+    current_distance = 0
+    while pending > 0:
+        bucket = buckets[current_distance % bucket_count]
+        while bucket:
+            current_vertex = bucket.pop()
+            pending -= 1
+            if distances[current_vertex] < current_distance:
+                continue
+
+            for neighbor, weight in graph[current_vertex].items():
+                distance = current_distance + weight
+                if distance < distances[neighbor]:
+                    if not 0 <= weight <= max_weight or weight % 1:
+                        raise ValueError(
+                            'weight {!r} is not an integer from 0 to {}'
+                            .format(weight, max_weight))
+                    distances[neighbor] = distance
+                    buckets[int(distance) % bucket_count].append(neighbor)
+                    pending += 1
+        current_distance += 1
+
+    return distances
+
+# calculate_distances_with_buckets(example_graph, 'X')
+# => {'U': 1, 'W': 2, 'V': 2, 'Y': 1, 'X': 0, 'Z': 2}
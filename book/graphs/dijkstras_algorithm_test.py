@@ -1,6 +1,14 @@
+import random
 import unittest
 
-from dijkstras_algorithm import example_graph, calculate_distances
+from dijkstras_algorithm import (
+    example_graph, calculate_distances, calculate_distances_with_decrease_key,
+    shortest_path, bidirectional_shortest_path, a_star_search,
+    euclidean_heuristic, manhattan_heuristic, hamming_distance,
+    calculate_shortest_path_tree, nearest_sources, path_to,
+    calculate_distances_with_buckets)
+from random_graphs import random_graph
+from word_ladder import word_graph
 
 
 CORRECT_DISTANCES = {
@@ -18,6 +26,150 @@ class TestCorrectness(unittest.TestCase):
                 calculate_distances(example_graph, starting_vertex),
                 distances)
 
+    def test_decrease_key_calculates_correctly(self):
+        for starting_vertex, distances in CORRECT_DISTANCES.items():
+            self.assertEqual(
+                calculate_distances_with_decrease_key(
+                    example_graph, starting_vertex),
+                distances)
+
+    def test_buckets_calculate_correctly(self):
+        for starting_vertex, distances in CORRECT_DISTANCES.items():
+            self.assertEqual(
+                calculate_distances_with_buckets(
+                    example_graph, starting_vertex),
+                distances)
+            self.assertEqual(
+                calculate_distances_with_buckets(
+                    example_graph, starting_vertex, max_weight=5),
+                distances)
+
+    def test_buckets_match_heap_on_random_graph(self):
+        graph = random_graph(500, 2000, max_weight=9, seed=5)
+        for vertex in range(0, 500, 7):
+            graph[vertex][(vertex + 1) % 500] = 0
+        self.assertEqual(calculate_distances_with_buckets(graph, 0),
+                         calculate_distances(graph, 0))
+        self.assertEqual(calculate_distances_with_buckets(graph, 0, 20),
+                         calculate_distances(graph, 0))
+
+    def test_buckets_reject_unsuitable_weights(self):
+        for weight in (1.5, -1):
+            graph = {'A': {'B': weight}, 'B': {}}
+            self.assertRaises(ValueError, calculate_distances_with_buckets,
+                              graph, 'A')
+        self.assertRaises(ValueError, calculate_distances_with_buckets,
+                          example_graph, 'X', 2)
+
+    def test_shortest_path_tree(self):
+        for starting_vertex, expected in CORRECT_DISTANCES.items():
+            distances, predecessors = calculate_shortest_path_tree(
+                example_graph, [starting_vertex])
+            self.assertEqual(distances, expected)
+            for vertex, distance in distances.items():
+                path = path_to(predecessors, vertex)
+                self.assertEqual(path[0], starting_vertex)
+                self.assert_valid_path(example_graph, path, distance)
+
+    def test_shortest_path_tree_from_multiple_sources(self):
+        graph = random_graph(300, 900, max_weight=9, seed=3)
+        sources = [0, 100, 200]
+        distances, predecessors = calculate_shortest_path_tree(graph, sources)
+        nearest = nearest_sources(predecessors)
+        from_each_source = [calculate_distances(graph, source)
+                            for source in sources]
+        for vertex in graph:
+            self.assertEqual(distances[vertex], min(
+                separate[vertex] for separate in from_each_source))
+            path = path_to(predecessors, vertex)
+            self.assertEqual(path[0], nearest[vertex])
+            self.assertIn(nearest[vertex], sources)
+            self.assert_valid_path(graph, path, distances[vertex])
+
+    def test_shortest_path_tree_within_radius(self):
+        graph = random_graph(300, 900, max_weight=9, seed=4)
+        everything = calculate_distances(graph, 0)
+        distances, predecessors = calculate_shortest_path_tree(
+            graph, [0], radius=8)
+        self.assertEqual(
+            distances, {vertex: distance for vertex, distance
+                        in everything.items() if distance <= 8})
+        self.assertEqual(set(predecessors), set(distances))
+
+    def assert_valid_path(self, graph, path, distance):
+        self.assertEqual(
+            sum(graph[a][b] for a, b in zip(path[:-1], path[1:])), distance)
+
+    def test_finds_single_shortest_paths(self):
+        for starting_vertex, distances in CORRECT_DISTANCES.items():
+            for target_vertex, expected_distance in distances.items():
+                for find_path in (shortest_path, bidirectional_shortest_path):
+                    distance, path = find_path(
+                        example_graph, starting_vertex, target_vertex)
+                    self.assertEqual(distance, expected_distance)
+                    self.assertEqual(path[0], starting_vertex)
+                    self.assertEqual(path[-1], target_vertex)
+                    self.assert_valid_path(example_graph, path, distance)
+
+    def test_bidirectional_search_on_directed_graph(self):
+        rng = random.Random(0)
+        graph = {vertex: {} for vertex in range(60)}
+        for _ in range(240):
+            a, b = rng.randrange(60), rng.randrange(60)
+            graph[a][b] = rng.randint(1, 9)
+        reverse_graph = {vertex: {} for vertex in graph}
+        for a in graph:
+            for b, weight in graph[a].items():
+                reverse_graph[b][a] = weight
+
+        for starting_vertex in range(0, 60, 7):
+            distances = calculate_distances(graph, starting_vertex)
+            for target_vertex in graph:
+                distance, path = bidirectional_shortest_path(
+                    graph, starting_vertex, target_vertex, reverse_graph)
+                self.assertEqual(distance, distances[target_vertex])
+                if path is None:
+                    self.assertEqual(distance, float('infinity'))
+                else:
+                    self.assert_valid_path(graph, path, distance)
+
+    def test_a_star_search_prunes_with_coordinates(self):
+        rng = random.Random(0)
+        size = 30
+        coordinates = {(x, y): (x, y)
+                       for x in range(size) for y in range(size)}
+        graph = {vertex: {} for vertex in coordinates}
+        for x, y in coordinates:
+            for neighbor in ((x + 1, y), (x, y + 1)):
+                if neighbor in graph:
+                    weight = rng.randint(1, 3)
+                    graph[(x, y)][neighbor] = weight
+                    graph[neighbor][(x, y)] = weight
+
+        start, target = (3, 4), (25, 20)
+        expected_distance = calculate_distances(graph, start)[target]
+        baseline_stats = {}
+        a_star_search(graph, start, target, lambda v, t: 0, baseline_stats)
+        for heuristic in (euclidean_heuristic(coordinates),
+                          manhattan_heuristic(coordinates)):
+            stats = {}
+            distance, path = a_star_search(
+                graph, start, target, heuristic, stats)
+            self.assertEqual(distance, expected_distance)
+            self.assert_valid_path(graph, path, distance)
+            self.assertLess(stats['settled'], baseline_stats['settled'])
+
+    def test_a_star_search_on_word_ladder(self):
+        graph = {word: {neighbor: 1 for neighbor in word_graph[word]}
+                 for word in word_graph}
+        baseline_stats, stats = {}, {}
+        a_star_search(graph, 'FOOL', 'SAGE', lambda v, t: 0, baseline_stats)
+        distance, path = a_star_search(
+            graph, 'FOOL', 'SAGE', hamming_distance, stats)
+        self.assertEqual(distance, 6)
+        self.assertEqual((path[0], path[-1]), ('FOOL', 'SAGE'))
+        self.assertLess(stats['settled'], baseline_stats['settled'])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""
+Kruskal’s algorithm is only one of many problems that come down to
+keeping track of which items have been joined together: the connected
+components of a graph, the clusters in a percolation simulation, or the
+pixels of an image region. A **disjoint set** (or **union-find**)
+structure answers exactly these questions, so it deserves a home of its
+own.
+
+The items are the integers $$0$$ to $$n - 1$$, which for a graph are
+simply vertex ids, and the whole structure is kept in two flat arrays.
+`parent[i]` is the parent of item `i` in the tree of its set, with the
+root of each tree being its own parent, and for each root `size[i]` is
+the number of items in its set. Compared to dictionaries, arrays use a
+small fraction of the memory, which matters when there are tens of
+millions of items.
+
+`find` uses **path halving**: as it climbs towards the root it points
+every other item it passes at its grandparent, which flattens the tree
+nearly as well as full path compression without needing a second pass.
+`union` hangs the smaller tree beneath the root of the larger one
+(**union by size**), so the size of each set is always at hand. With
+both in place, any sequence of operations takes an amortized time per
+operation that grows so slowly (as the inverse of Ackermann’s function)
+that it is constant for any practical purpose.
+"""
+
+from array import array
+
+
+class DisjointSet(object):
+    def __init__(self, size):
+        self.parent = array('l', range(size))
+        self.size = array('l', [1]) * size
+        self.count = size
+
+    def __len__(self):
+        return len(self.parent)
+
+    def find(self, item):
+        parent = self.parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def union(self, a, b):
+        a, b = self.find(a), self.find(b)
+        if a == b:
+            return False
+        size = self.size
+        if size[a] < size[b]:
+            a, b = b, a
+        self.parent[b] = a
+        size[a] += size[b]
+        self.count -= 1
+        return True
+
+    def connected(self, a, b):
+        return self.find(a) == self.find(b)
+
+    def component_size(self, item):
+        return self.size[self.find(item)]
+
+    """
+Joining a large number of pairs at once, such as every edge of a graph,
+is common enough to be worth a method of its own. `union_edges` takes two
+parallel sequences of items (the `sources` and `targets` arrays of an
+edge list, for example) and does the same work as calling `union` for
+each pair, but with `find` written out inline, which avoids two method
+calls per pair. It returns the number of pairs which joined two
+different sets.
+"""
+
+    def union_edges(self, sources, targets):
+        parent, size = self.parent, self.size
+        joined = 0
+        for a, b in zip(sources, targets):
+            while parent[a] != a:
+                parent[a] = parent[parent[a]]
+                a = parent[a]
+            while parent[b] != b:
+                parent[b] = parent[parent[b]]
+                b = parent[b]
+            if a != b:
+                if size[a] < size[b]:
+                    a, b = b, a
+                parent[b] = a
+                size[a] += size[b]
+                joined += 1
+        self.count -= joined
+        return joined
+
+"""
+For example, the connected components of an undirected graph in our
+usual format are found by joining the ids of the two ends of every edge.
+As with strongly connected components, we return the vertices in a list
+alongside an array holding the number of each vertex’s component.
+"""
+
+
+def connected_components(graph):
+    vertices = list(graph)
+    ids = {vertex: i for i, vertex in enumerate(vertices)}
+    components = DisjointSet(len(vertices))
+    for vertex in vertices:
+        i = ids[vertex]
+        components.union_edges(
+            [i] * len(graph[vertex]),
+            [ids[neighbor] for neighbor in graph[vertex]])
+
+    numbers = {}
+    labels = array('l', [0]) * len(vertices)
+    for i in range(len(vertices)):
+        labels[i] = numbers.setdefault(components.find(i), len(numbers))
+    return vertices, labels
+
+# components = DisjointSet(5)
+# components.union(0, 1)  # => True
+# components.union(3, 4)  # => True
+# components.union(1, 0)  # => False
+# components.count  # => 3
+# components.component_size(1)  # => 2
+# connected_components({'A': ['B'], 'B': ['A'], 'C': []})
+# => (['A', 'B', 'C'], array('l', [0, 0, 1]))
@@ -0,0 +1,71 @@
+from array import array
+import random
+import unittest
+
+from disjoint_set import DisjointSet, connected_components
+
+
+class TestCorrectness(unittest.TestCase):
+
+    def test_union_and_find(self):
+        components = DisjointSet(6)
+        self.assertTrue(components.union(0, 1))
+        self.assertTrue(components.union(2, 1))
+        self.assertTrue(components.union(3, 4))
+        self.assertFalse(components.union(0, 2))
+        self.assertEqual(components.count, 3)
+        self.assertEqual(len(components), 6)
+        self.assertTrue(components.connected(0, 2))
+        self.assertFalse(components.connected(0, 3))
+        self.assertEqual(components.component_size(2), 3)
+        self.assertEqual(components.component_size(4), 2)
+        self.assertEqual(components.component_size(5), 1)
+
+    def test_union_edges_matches_union(self):
+        rng = random.Random(0)
+        sources = array('l', [rng.randrange(1000) for _ in range(800)])
+        targets = array('l', [rng.randrange(1000) for _ in range(800)])
+        one_at_a_time = DisjointSet(1000)
+        joined = sum(one_at_a_time.union(a, b)
+                     for a, b in zip(sources, targets))
+        in_bulk = DisjointSet(1000)
+        self.assertEqual(in_bulk.union_edges(sources, targets), joined)
+        self.assertEqual(in_bulk.count, one_at_a_time.count)
+        for item in range(1000):
+            self.assertEqual(in_bulk.component_size(item),
+                             one_at_a_time.component_size(item))
+            self.assertEqual(
+                in_bulk.connected(item, 0), one_at_a_time.connected(item, 0))
+
+    def test_trees_stay_shallow(self):
+        size = 2 ** 12
+        components = DisjointSet(size)
+        for a, b in zip(range(0, size, 2), range(1, size, 2)):
+            components.union(a, b)
+        step = 2
+        while step < size:
+            for a in range(0, size, 2 * step):
+                components.union(a, a + step)
+            step *= 2
+        self.assertEqual(components.count, 1)
+        for item in range(size):
+            depth = 0
+            while components.parent[item] != item:
+                item = components.parent[item]
+                depth += 1
+            self.assertLessEqual(depth, 12)
+
+    def test_connected_components(self):
+        graph = {'A': ['B'], 'B': ['A', 'C'], 'C': ['B'], 'D': ['E'],
+                 'E': ['D'], 'F': []}
+        vertices, components = connected_components(graph)
+        groups = {}
+        for vertex, component in zip(vertices, components):
+            groups.setdefault(component, set()).add(vertex)
+        self.assertEqual(sorted(map(sorted, groups.values())),
+                         [['A', 'B', 'C'], ['D', 'E'], ['F']])
+        self.assertEqual(sorted(groups), [0, 1, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
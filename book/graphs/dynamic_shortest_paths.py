@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+"""
+The costs of the links between routers change all the time, with the
+time of day and with the traffic they carry, and rerunning
+`calculate_distances` over the whole graph every time a single link
+changes is wasteful. Most changes affect the shortest paths to only a
+handful of vertices, if any.
+
+`DynamicShortestPaths` keeps the distances from a single source, along
+with the tree of shortest paths itself: the `predecessors` of each
+vertex, as in `shortest_path`, and the reverse of those links, the
+`children` of each vertex in the tree. It also keeps its own copy of the
+graph along with the reverse of every edge, so that we can find the
+edges leading *into* a vertex. Then when the weight of an edge
+$$(u, v)$$ changes, there are two cases:
+
+-   If the edge has become cheaper (or is new), the only vertices whose
+    distance can change are those whose best path now uses it. If it
+    improves the distance to $$v$$, we update $$v$$ and carry on with
+    Dijkstra’s algorithm from there, which only ever visits vertices
+    whose distances improve.
+-   If the edge has become more expensive (or has been removed), nothing
+    changes unless it is an edge of the tree. If it is, the distances of
+    $$v$$ and all of its descendants in the tree are suspect, and every
+    other vertex is unaffected. We forget the suspect distances, give
+    each suspect vertex the best distance it can get through an edge
+    from an unaffected vertex, and then run Dijkstra’s algorithm over
+    the suspect vertices alone.
+
+Either way, the work done is proportional to the part of the tree that
+actually changes, rather than to the size of the whole graph. Weights
+must be non-negative, as for Dijkstra’s algorithm; for an undirected
+graph, update the edge in both directions.
+"""
+
+from collections import defaultdict
+import heapq
+
+from dijkstras_algorithm import calculate_shortest_path_tree, path_to
+
+
+class DynamicShortestPaths(object):
+    def __init__(self, graph, source):
+        self.source = source
+        self.successors = defaultdict(dict)
+        self.reverse = defaultdict(dict)
+        for vertex in graph:
+            for neighbor, weight in graph[vertex].items():
+                self.successors[vertex][neighbor] = weight
+                self.reverse[neighbor][vertex] = weight
+
+        self.distances, self.predecessors = calculate_shortest_path_tree(
+            self.successors, [source])
+        self.children = defaultdict(set)
+        for vertex, predecessor in self.predecessors.items():
+            if predecessor is not None:
+                self.children[predecessor].add(vertex)
+
+    def distance(self, vertex):
+        return self.distances.get(vertex, float('infinity'))
+
+    def path_to(self, vertex):
+        if vertex not in self.distances:
+            return None
+        return path_to(self.predecessors, vertex)
+
+    def set_weight(self, u, v, weight):
+        old_weight = self.successors[u].get(v)
+        self.successors[u][v] = weight
+        self.reverse[v][u] = weight
+        if old_weight is None or weight < old_weight:
+            distance = self.distance(u) + weight
+            if distance < self.distance(v):
+                self.distances[v] = distance
+                self._set_predecessor(v, u)
+                self._propagate([(distance, v)])
+        elif weight > old_weight and self.predecessors.get(v) == u:
+            self._repair_subtree(v)
+
+    add_edge = set_weight
+
+    def remove_edge(self, u, v):
+        del self.successors[u][v]
+        del self.reverse[v][u]
+        if self.predecessors.get(v) == u:
+            self._repair_subtree(v)
+
+    def _repair_subtree(self, root):
+        affected = [root]
+        for vertex in affected:
+            affected.extend(self.children[vertex])
+        suspect = set(affected)
+        for vertex in affected:
+            del self.distances[vertex]
+            self._set_predecessor(vertex, None)
+            del self.predecessors[vertex]
+
+        pq = []
+        for vertex in affected:
+            best, best_predecessor = float('infinity'), None
+            for predecessor, weight in self.reverse[vertex].items():
+                if predecessor not in suspect and \
+                        self.distance(predecessor) + weight < best:
+                    best = self.distance(predecessor) + weight
+                    best_predecessor = predecessor
+            if best_predecessor is not None:
+                self.distances[vertex] = best
+                self._set_predecessor(vertex, best_predecessor)
+                pq.append((best, vertex))
+        heapq.heapify(pq)
+        self._propagate(pq)
+
+    def _propagate(self, pq):
+        distances = self.distances
+        while pq:
+            current_distance, current_vertex = heapq.heappop(pq)
+            if current_distance > distances[current_vertex]:
+                continue
+            for neighbor, weight in self.successors[current_vertex].items():
+                distance = current_distance + weight
+                if distance < distances.get(neighbor, float('infinity')):
+                    distances[neighbor] = distance
+                    self._set_predecessor(neighbor, current_vertex)
+                    heapq.heappush(pq, (distance, neighbor))
+
+    def _set_predecessor(self, vertex, predecessor):
+        old_predecessor = self.predecessors.get(vertex)
+        if old_predecessor is not None:
+            self.children[old_predecessor].discard(vertex)
+        self.predecessors[vertex] = predecessor
+        if predecessor is not None:
+            self.children[predecessor].add(vertex)
+
+# paths = DynamicShortestPaths(example_graph, 'U')
+# paths.path_to('Z')  # => ['U', 'X', 'Y', 'Z']
+# paths.set_weight('X', 'Y', 10)
+# paths.distance('Z'), paths.path_to('Z')  # => (6, ['U', 'X', 'W', 'Y', 'Z'])
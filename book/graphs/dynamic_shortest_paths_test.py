@@ -0,0 +1,70 @@
+import random
+import unittest
+
+from dijkstras_algorithm import calculate_distances, example_graph
+from dynamic_shortest_paths import DynamicShortestPaths
+from random_graphs import random_digraph
+
+
+class TestCorrectness(unittest.TestCase):
+
+    def assert_consistent(self, graph, paths):
+        expected = calculate_distances(graph, paths.source)
+        for vertex in graph:
+            self.assertEqual(paths.distance(vertex), expected[vertex])
+            path = paths.path_to(vertex)
+            if expected[vertex] == float('infinity'):
+                self.assertIsNone(path)
+                continue
+            self.assertEqual(path[0], paths.source)
+            self.assertEqual(path[-1], vertex)
+            self.assertEqual(
+                sum(graph[a][b] for a, b in zip(path[:-1], path[1:])),
+                expected[vertex])
+        for vertex, children in paths.children.items():
+            for child in children:
+                self.assertEqual(paths.predecessors[child], vertex)
+
+    def test_example_graph(self):
+        graph = {vertex: dict(edges) for vertex, edges
+                 in example_graph.items()}
+        paths = DynamicShortestPaths(graph, 'U')
+        self.assertEqual(paths.path_to('Z'), ['U', 'X', 'Y', 'Z'])
+        for u, v, weight in (('X', 'Y', 10), ('U', 'W', 1),
+                             ('W', 'Z', 0), ('U', 'X', 7)):
+            graph[u][v] = weight
+            paths.set_weight(u, v, weight)
+            self.assert_consistent(graph, paths)
+
+    def test_random_updates(self):
+        rng = random.Random(1)
+        graph = random_digraph(200, 800)
+        paths = DynamicShortestPaths(graph, 0)
+        self.assert_consistent(graph, paths)
+        for _ in range(300):
+            a, b = rng.sample(range(200), 2)
+            action = rng.random()
+            if action < 0.2 and b in graph[a]:
+                del graph[a][b]
+                paths.remove_edge(a, b)
+            else:
+                graph[a][b] = rng.randint(1, 20)
+                paths.set_weight(a, b, graph[a][b])
+            self.assert_consistent(graph, paths)
+
+    def test_disconnecting_and_reconnecting(self):
+        graph = {'A': {'B': 1}, 'B': {'C': 1}, 'C': {}, 'D': {'C': 5}}
+        paths = DynamicShortestPaths(graph, 'A')
+        paths.remove_edge('A', 'B')
+        self.assertEqual(paths.distance('C'), float('infinity'))
+        self.assertIsNone(paths.path_to('B'))
+        paths.add_edge('A', 'D', 2)
+        self.assertEqual(paths.distance('C'), 7)
+        self.assertEqual(paths.path_to('C'), ['A', 'D', 'C'])
+        paths.add_edge('A', 'B', 3)
+        self.assertEqual(paths.path_to('C'), ['A', 'B', 'C'])
+        self.assertEqual(paths.distance('C'), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
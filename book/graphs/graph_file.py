@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+"""
+Building a large graph can take much longer than searching it, and every
+process that needs the graph pays that cost again. Since a `CSRGraph` is
+nothing more than a few flat arrays, we can instead write those arrays to
+a file once, and have each process map the file into memory with Python’s
+`mmap` module. Opening a mapped file is almost instantaneous: the
+operating system only reads the pages of the file that are actually
+touched, and processes mapping the same file share the same pages of
+physical memory.
+
+The file consists of a fixed size header, followed by the `offsets`,
+`targets` and (optionally) `weights` arrays as little-endian 64 bit
+values. Graphs labeled with strings, such as the word ladder graph,
+also store each vertex label as UTF-8 text, along with an array of the
+offsets at which each label begins. The vertices are numbered in the
+sorted order of their labels, which lets us find the id of a label by
+binary searching the file rather than by building a dictionary of every
+label up front.
+
+Other labels, such as the `(row, col)` squares of the knight’s tour
+graph, integers which are not simply $$0$$ to $$V - 1$$, or Python 3
+`bytes`, are stored in the same way but pickled rather than encoded as
+text, so that they come back exactly as they were written. Pickled
+labels do not sort in any useful order, so for these the vertices keep
+their original numbering and the dictionary from labels to ids is built
+the first time it is needed, just as for a `CSRGraph` in memory. As with
+any pickled data, only open graph files from sources you trust.
+
+`open_graph` returns a `MappedGraph`, which is a `CSRGraph` whose arrays
+are read directly from the mapped file, so it can be passed to any of
+the algorithms in this chapter without first being converted back into
+dictionaries.
+"""
+
+from array import array
+import mmap
+import pickle
+import struct
+import sys
+
+from csr_graph import CSRGraph
+
+MAGIC = b'CSRG'
+VERSION = 1
+HEADER = struct.Struct('<4sIIqq4x')
+
+WEIGHTED = 1
+FLOAT_WEIGHTS = 2
+LABELED = 4
+PICKLED_LABELS = 8
+
+
+def write_graph(graph, path):
+    if not isinstance(graph, CSRGraph):
+        graph = CSRGraph.from_dict(graph)
+    vertex_count = len(graph)
+
+    pickled = False
+    if graph.vertices is None or \
+            list(graph.vertices) == list(range(vertex_count)):
+        labels = None
+        order = list(range(vertex_count))
+    elif all(isinstance(vertex, str)
+             for vertex in graph.vertices):
+        labels = [_encode_label(vertex) for vertex in graph.vertices]
+        order = sorted(range(vertex_count), key=labels.__getitem__)
+    else:
+        pickled = True
+        labels = [pickle.dumps(vertex, 2) for vertex in graph.vertices]
+        order = list(range(vertex_count))
+    new_ids = array('l', [0]) * vertex_count
+    for new_id, old_id in enumerate(order):
+        new_ids[old_id] = new_id
+
+    flags = 0
+    if graph.weights is not None:
+        flags |= WEIGHTED
+        if _weight_typecode(graph.weights) == 'd':
+            flags |= FLOAT_WEIGHTS
+    if labels is not None:
+        flags |= LABELED
+    if pickled:
+        flags |= PICKLED_LABELS
+
+    offsets, targets, weights = [0], [], []
+    for old_id in order:
+        edges = sorted(zip(
+            (new_ids[target] for target in graph.neighbor_ids(old_id)),
+            graph.edge_weights(old_id)))
+        targets.extend(target for target, _ in edges)
+        weights.extend(weight for _, weight in edges)
+        offsets.append(len(targets))
+
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(
+            MAGIC, VERSION, flags, vertex_count, len(targets)))
+        _write_values(f, 'q', offsets)
+        _write_values(f, 'q', targets)
+        if flags & WEIGHTED:
+            _write_values(f, 'd' if flags & FLOAT_WEIGHTS else 'q', weights)
+        if labels is not None:
+            label_offsets = [0]
+            for old_id in order:
+                label_offsets.append(label_offsets[-1] + len(labels[old_id]))
+            _write_values(f, 'q', label_offsets)
+            for old_id in order:
+                f.write(labels[old_id])
+
+
+def open_graph(path):
+    return MappedGraph(path)
+
+
+class MappedGraph(CSRGraph):
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, flags, vertex_count, edge_count = \
+            HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError('{} is not a graph file'.format(path))
+
+        position = HEADER.size
+        offsets = _map_values(self._map, position, 'q', vertex_count + 1)
+        position += 8 * (vertex_count + 1)
+        targets = _map_values(self._map, position, 'q', edge_count)
+        position += 8 * edge_count
+        weights = None
+        if flags & WEIGHTED:
+            weights = _map_values(
+                self._map, position, 'd' if flags & FLOAT_WEIGHTS else 'q',
+                edge_count)
+            position += 8 * edge_count
+        vertices = None
+        if flags & LABELED:
+            label_offsets = _map_values(
+                self._map, position, 'q', vertex_count + 1)
+            position += 8 * (vertex_count + 1)
+            vertices = MappedLabels(
+                self._map, position, label_offsets,
+                pickle.loads if flags & PICKLED_LABELS else _decode_label)
+        self.pickled_labels = bool(flags & PICKLED_LABELS)
+
+        CSRGraph.__init__(self, offsets, targets, weights, vertices)
+
+    def vertex_id(self, vertex):
+        if self.vertices is None or self.pickled_labels:
+            return CSRGraph.vertex_id(self, vertex)
+        try:
+            i = self.vertices.find(_encode_label(vertex))
+        except TypeError:
+            raise KeyError(vertex)
+        if i is None:
+            raise KeyError(vertex)
+        return i
+
+    def close(self):
+        for values in (self.offsets, self.targets, self.weights,
+                       self.vertices and self.vertices.offsets):
+            if hasattr(values, 'release'):
+                values.release()
+        self._map.close()
+
+
+class MappedLabels(object):
+    def __init__(self, data, start, offsets, decode=None):
+        self.data = data
+        self.start = start
+        self.offsets = offsets
+        self.decode = decode or _decode_label
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):
+        return self.decode(self._label_bytes(i))
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+    def find(self, label_bytes):
+        low, high = 0, len(self)
+        while low < high:
+            middle = (low + high) // 2
+            if self._label_bytes(middle) < label_bytes:
+                low = middle + 1
+            else:
+                high = middle
+        if low < len(self) and self._label_bytes(low) == label_bytes:
+            return low
+        return None
+
+    def _label_bytes(self, i):
+        return self.data[self.start + self.offsets[i]:
+                         self.start + self.offsets[i + 1]]
+
+
+class MappedValues(object):
+    # read values straight out of the mapped file on platforms where
+    # memoryview cannot reinterpret it as an array of 64 bit values
+    def __init__(self, data, start, typecode, length):
+        self.data = data
+        self.start = start
+        self.format = '<' + typecode
+        self.length = length
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, _ = index.indices(self.length)
+            return struct.unpack_from(
+                '<{}{}'.format(max(stop - start, 0), self.format[1:]),
+                self.data, self.start + 8 * start)
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError(index)
+        return struct.unpack_from(
+            self.format, self.data, self.start + 8 * index)[0]
+
+    def __iter__(self):
+        return iter(self[:])
+
+
+def _map_values(data, start, typecode, length):
+    if sys.byteorder == 'little' and hasattr(memoryview, 'cast'):
+        return memoryview(data)[start:start + 8 * length].cast(typecode)
+    return MappedValues(data, start, typecode, length)
+
+
+def _weight_typecode(weights):
+    # arrays have a typecode, while the memoryviews and MappedValues of a
+    # MappedGraph describe their values with a struct format
+    typecode = getattr(weights, 'typecode', None)
+    if typecode is None:
+        typecode = weights.format[-1]
+    return typecode
+
+
+def _write_values(f, typecode, values, chunk_size=65536):
+    for i in range(0, len(values), chunk_size):
+        chunk = values[i:i + chunk_size]
+        f.write(struct.pack('<{}{}'.format(len(chunk), typecode), *chunk))
+
+
+def _encode_label(label):
+    if not isinstance(label, str):
+        raise TypeError('cannot store vertex label {!r}'.format(label))
+    if str is bytes:
+        return label
+    return label.encode('utf-8')
+
+
+def _decode_label(label_bytes):
+    if str is bytes:
+        return label_bytes
+    return label_bytes.decode('utf-8')
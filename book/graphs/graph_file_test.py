@@ -0,0 +1,110 @@
+import os
+import shutil
+import tempfile
+import unittest
+from array import array
+
+from csr_graph import CSRGraph
+from depth_first_search import depth_first_search, simple_graph
+from dijkstras_algorithm import calculate_distances, example_graph
+from graph_file import HEADER, MappedValues, open_graph, write_graph
+from knights_tour import build_graph
+from prims_spanning_tree import create_spanning_tree
+from prims_spanning_tree import example_graph as prims_example_graph
+from word_ladder import traverse, word_graph
+
+
+class TestCorrectness(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def round_trip(self, graph):
+        path = os.path.join(self.directory, 'graph.bin')
+        write_graph(graph, path)
+        mapped = open_graph(path)
+        self.addCleanup(mapped.close)
+        return mapped
+
+    def test_round_trips_weighted_graph(self):
+        graph = self.round_trip(example_graph)
+        self.assertEqual(list(graph), sorted(example_graph))
+        self.assertEqual(graph.to_dict(), example_graph)
+        self.assertIn('Z', graph)
+        self.assertNotIn('Q', graph)
+        self.assertEqual(
+            calculate_distances(graph, 'X'),
+            calculate_distances(example_graph, 'X'))
+
+    def test_round_trips_integer_graph(self):
+        sources = array('l', [0, 0, 1, 2])
+        targets = array('l', [1, 2, 2, 0])
+        weights = array('d', [0.5, 1.5, 2.5, 3.5])
+        graph = self.round_trip(
+            CSRGraph.from_edges(3, sources, targets, weights))
+        self.assertIsNone(graph.vertices)
+        self.assertEqual(graph.to_dict(), {
+            0: {1: 0.5, 2: 1.5}, 1: {2: 2.5}, 2: {0: 3.5}})
+
+    def test_round_trips_graphs_with_other_labels(self):
+        knights_graph = build_graph(5)
+        graph = self.round_trip(knights_graph)
+        self.assertEqual(list(graph), list(knights_graph))
+        self.assertEqual(set(graph[0, 0]), knights_graph[0, 0])
+        self.assertIn((2, 1), graph[0, 0])
+        self.assertNotIn((9, 9), graph)
+
+        numbered = {10: {20: 1, 30: 2}, 20: {10: 1}, 30: {10: 2}}
+        graph = self.round_trip(numbered)
+        self.assertEqual(graph.to_dict(), numbered)
+        self.assertEqual(calculate_distances(graph, 20),
+                         {10: 1, 20: 0, 30: 3})
+
+    def test_looks_up_other_types_in_text_labelled_graph(self):
+        graph = self.round_trip(example_graph)
+        self.assertNotIn(5, graph)
+        self.assertNotIn(('U', 'V'), graph)
+        self.assertRaises(KeyError, graph.__getitem__, 5)
+        self.assertNotIn(5, graph['U'])
+
+    def test_round_trips_bytes_labels(self):
+        graph = {b'A': {b'B': 1}, b'B': {}}
+        self.assertEqual(self.round_trip(graph).to_dict(), graph)
+
+    def test_round_trips_mapped_graph(self):
+        weights = array('d', [0.5, 1.5])
+        graph = CSRGraph.from_edges(2, array('l', [0, 1]),
+                                    array('l', [1, 0]), weights)
+        mapped = self.round_trip(self.round_trip(graph))
+        self.assertEqual(mapped.to_dict(), {0: {1: 0.5}, 1: {0: 1.5}})
+        mapped = self.round_trip(self.round_trip(example_graph))
+        self.assertEqual(mapped.to_dict(), example_graph)
+
+    def test_reads_values_without_memoryview_cast(self):
+        path = os.path.join(self.directory, 'graph.bin')
+        write_graph(example_graph, path)
+        with open(path, 'rb') as f:
+            data = f.read()
+        offsets = MappedValues(data, HEADER.size, 'q', len(example_graph) + 1)
+        self.assertEqual(list(offsets), [0, 3, 6, 11, 15, 18, 20])
+        self.assertEqual(offsets[2:4], (6, 11))
+        self.assertEqual(offsets[-1], 20)
+
+    def test_algorithms_accept_mapped_graphs(self):
+        self.assertEqual(
+            create_spanning_tree(self.round_trip(prims_example_graph), 'A'),
+            create_spanning_tree(prims_example_graph, 'A'))
+        self.assertEqual(
+            depth_first_search(self.round_trip(simple_graph), 'A'),
+            depth_first_search(simple_graph, 'A'))
+        self.assertEqual(
+            [len(path) for _, path in
+             traverse(self.round_trip(word_graph), 'FOOL')],
+            [len(path) for _, path in traverse(word_graph, 'FOOL')])
+
+
+if __name__ == '__main__':
+    unittest.main()
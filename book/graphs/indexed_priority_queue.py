@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""
+The priority queues we have used so far, whether our own `BinaryHeap` or
+Python’s `heapq` module, have no way to find an item once it has been
+added. If the priority of an item changes, the best we can do is add
+another entry for the same item and ignore the stale one when it
+eventually reaches the front of the queue.
+
+An **indexed priority queue** removes this limitation by keeping a
+second dictionary, alongside the heap itself, which records the position
+of every item in the heap. With the position of an item at hand we can
+change its priority in place and percolate it to its new position in
+$$O(\log{n})$$ time. This operation is usually called `decrease_key`, and
+it means that the queue never holds more than one entry per item.
+"""
+
+
+class IndexedPriorityQueue(object):
+    def __init__(self):
+        self._heap = []
+        self._priorities = {}
+        self._positions = {}
+
+    def __len__(self):
+        return len(self._heap)
+
+    def __contains__(self, item):
+        return item in self._positions
+
+    def priority(self, item):
+        return self._priorities[item]
+
+    def push(self, item, priority):
+        if item in self._positions:
+            raise ValueError('{!r} is already in the queue'.format(item))
+        self._heap.append(item)
+        self._priorities[item] = priority
+        self._percolate_up(len(self._heap) - 1)
+
+    def decrease_key(self, item, priority):
+        if priority > self._priorities[item]:
+            raise ValueError('cannot increase the priority of {!r}'.format(
+                item))
+        self._priorities[item] = priority
+        self._percolate_up(self._positions[item])
+
+    def peek(self):
+        item = self._heap[0]
+        return self._priorities[item], item
+
+    def pop(self):
+        heap = self._heap
+        item = heap[0]
+        last_item = heap.pop()
+        if heap:
+            heap[0] = last_item
+            self._percolate_down(0)
+        del self._positions[item]
+        return self._priorities.pop(item), item
+
+    """
+Rather than swapping an item with its parent or child at every level, as
+`BinaryHeap` does, the two percolate methods below hold the moving item
+aside and shift the items it passes over into the “hole” it leaves
+behind, writing it into the heap (and recording its position) only once
+it reaches its final place.
+"""
+
+    def _percolate_up(self, i):
+        heap, priorities, positions = self._heap, self._priorities, \
+            self._positions
+        item = heap[i]
+        priority = priorities[item]
+        while i > 0:
+            parent_index = (i - 1) // 2
+            parent = heap[parent_index]
+            if priorities[parent] <= priority:
+                break
+            heap[i] = parent
+            positions[parent] = i
+            i = parent_index
+        heap[i] = item
+        positions[item] = i
+
+    def _percolate_down(self, i):
+        heap, priorities, positions = self._heap, self._priorities, \
+            self._positions
+        size = len(heap)
+        item = heap[i]
+        priority = priorities[item]
+        while 2 * i + 1 < size:
+            child_index = 2 * i + 1
+            child = heap[child_index]
+            if child_index + 1 < size and \
+                    priorities[heap[child_index + 1]] < priorities[child]:
+                child_index += 1
+                child = heap[child_index]
+            if priority <= priorities[child]:
+                break
+            heap[i] = child
+            positions[child] = i
+            i = child_index
+        heap[i] = item
+        positions[item] = i
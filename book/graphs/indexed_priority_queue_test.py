@@ -0,0 +1,47 @@
+import random
+import unittest
+
+from indexed_priority_queue import IndexedPriorityQueue
+
+
+class TestCorrectness(unittest.TestCase):
+
+    def test_pops_in_priority_order(self):
+        rng = random.Random(0)
+        priorities = {item: rng.randint(0, 50) for item in range(200)}
+        pq = IndexedPriorityQueue()
+        for item, priority in priorities.items():
+            pq.push(item, priority)
+        for item in range(0, 200, 3):
+            priorities[item] -= rng.randint(0, 20)
+            pq.decrease_key(item, priorities[item])
+
+        popped = []
+        while len(pq) > 0:
+            popped.append(pq.pop())
+        self.assertEqual(
+            [priority for priority, _ in popped],
+            sorted(priorities.values()))
+        self.assertEqual(
+            dict((item, priority) for priority, item in popped), priorities)
+
+    def test_tracks_membership(self):
+        pq = IndexedPriorityQueue()
+        pq.push('a', 3)
+        pq.push('b', 1)
+        self.assertIn('a', pq)
+        self.assertEqual(pq.peek(), (1, 'b'))
+        pq.decrease_key('a', 0)
+        self.assertEqual(pq.pop(), (0, 'a'))
+        self.assertNotIn('a', pq)
+        self.assertEqual(len(pq), 1)
+
+    def test_rejects_invalid_updates(self):
+        pq = IndexedPriorityQueue()
+        pq.push('a', 3)
+        self.assertRaises(ValueError, pq.push, 'a', 2)
+        self.assertRaises(ValueError, pq.decrease_key, 'a', 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
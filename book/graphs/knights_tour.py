@@ -157,7 +157,7 @@ def find_solution_for(board_size, heuristic=lambda graph: None):
             return False
 
         # try all valid paths from here
-        next_vertices = sorted(yet_to_visit, heuristic(graph))
+        next_vertices = sorted(yet_to_visit, key=heuristic(graph))
         return first_true(traverse(path + [current_vertex], vertex)
                           for vertex in next_vertices)
 
@@ -279,13 +279,13 @@ complete the knight’s tour.
 
 
 def warnsdorffs_heuristic(graph):
-    
-    #Given a graph, return a comparator function that prioritizes nodes
-    #with the fewest subsequent moves
-    def comparator(a, b):
-        return len(graph[a]) - len(graph[b])
 
-    return comparator
+    # Given a graph, return a key function that prioritizes nodes
+    # with the fewest subsequent moves
+    def key(vertex):
+        return len(graph[vertex])
+
+    return key
 
 # find_solution_for(8, warnsdorffs_heuristic)
 # => [(7, 3), (6, 1), (4, 0), (2, 1), (0, 0), (1, 2), ... ]
@@ -296,3 +296,345 @@ tour created using Warnsdorff’s heuristic:
 
 ![130x130 open tour](figures/knights-tour-130.png)
 """
+
+"""
+A Bitboard Knight’s Tour
+---
+
+Our `traverse` function does a surprising amount of work at every step:
+it builds a set of every square in the path so far, subtracts it from the
+legal moves, sorts the result, and copies the path to extend it by one
+square. On a large board each of these costs time proportional to the
+length of the path, and they all create new objects which must be
+allocated and later thrown away.
+
+Chess programs avoid this work by representing sets of squares as
+**bitboards**: integers in which bit `row * board_size + col` is set if
+the square at `(row, col)` is in the set. The squares a knight can move
+to from each square are computed once, as a list of `move_masks`, and
+the squares visited so far are a single integer, `visited`. The unvisited
+squares we can move to from `square` are then just
+`move_masks[square] & ~visited`, and visiting or un-visiting a square is
+a single bitwise operation.
+
+The search below also avoids recursion and path copying. It keeps the
+path in a list with one slot per square, along with a second list,
+`untried`, holding the bitboard of moves not yet tried from each square
+on the path. At each step we either try the next move from the square at
+the end of the path, or, if there are none left, back up by one square.
+
+When `warnsdorff` is true, the next move is chosen as in Warnsdorff’s
+heuristic, with one difference: since counting the unvisited squares
+reachable from a square is now so cheap, we count only the moves to
+squares which have *not yet been visited*, rather than all of the
+square’s legal moves.
+"""
+
+
+def move_masks_for(board_size):
+    masks = []
+    for row in range(board_size):
+        for col in range(board_size):
+            mask = 0
+            for to_row, to_col in legal_moves_from(row, col, board_size):
+                mask |= 1 << (to_row * board_size + to_col)
+            masks.append(mask)
+    return masks
+
+
+def count_squares(bitboard):
+    return bin(bitboard).count('1')
+
+
+def find_solution_with_bitboard(board_size, warnsdorff=True):
+    move_masks = move_masks_for(board_size)
+    total_squares = board_size * board_size
+    path = [0] * total_squares
+    untried = [0] * total_squares
+
+    for starting_square in range(total_squares):
+        if not move_masks[starting_square]:
+            continue
+        path[0] = starting_square
+        visited = 1 << starting_square
+        untried[0] = move_masks[starting_square]
+        depth = 0
+
+        while depth >= 0:
+            if depth == total_squares - 1:
+                return [divmod(square, board_size) for square in path]
+
+            moves = untried[depth]
+            if not moves:
+                # dead end, so back up to the previous square
+                visited &= ~(1 << path[depth])
+                depth -= 1
+                continue
+
+            # choose the untried move with the fewest onward moves
+            next_square, fewest_moves = None, None
+            while moves:
+                lowest_bit = moves & -moves
+                moves ^= lowest_bit
+                square = lowest_bit.bit_length() - 1
+                onward_moves = count_squares(move_masks[square] & ~visited) \
+                    if warnsdorff else 0
+                if fewest_moves is None or onward_moves < fewest_moves:
+                    next_square, fewest_moves = square, onward_moves
+
+            untried[depth] &= ~(1 << next_square)
+            depth += 1
+            path[depth] = next_square
+            visited |= 1 << next_square
+            untried[depth] = move_masks[next_square] & ~visited
+
+    return None
+
+# find_solution_with_bitboard(8)
+# => [(0, 0), (1, 2), (0, 4), (1, 6), (3, 7), (5, 6), ... ]
+
+"""
+Searching Without Recursion
+---
+
+Since `traverse` calls itself once for every square in the path, a tour
+of a board with more squares than Python’s recursion limit (1,000 by
+default) can never be found that way, however good our heuristic. To
+search larger boards we can manage the stack ourselves, just as
+`find_solution_with_bitboard` does, but using the same graph and the same
+`heuristic` argument as `find_solution_for`.
+
+Each entry on our `stack` is the list of vertices still to be tried from
+the corresponding square in `path`, sorted so that the vertex to try
+first is at the end of the list and can be popped off cheaply. Moving
+forward pushes a new list onto the stack, and backing up pops one off.
+
+A search of a large board can also take a very long time if our
+heuristic leads it astray. So that callers can put a limit on this,
+`find_solution_iteratively` accepts an optional budget of the number of
+squares it may visit (`max_nodes`) and of the number of seconds it may
+run (`time_limit`), raising `SearchBudgetExceeded` if either runs out
+before the search is finished. The exception carries the partial `path`
+the search had reached at that point.
+"""
+
+import random
+import time
+
+
+class SearchBudgetExceeded(Exception):
+    def __init__(self, message, path):
+        Exception.__init__(self, message)
+        self.path = path
+
+
+def find_solution_iteratively(board_size, heuristic=lambda graph: None,
+                              max_nodes=None, time_limit=None,
+                              starting_vertices=None):
+    graph = build_graph(board_size)
+    total_squares = board_size * board_size
+    key = heuristic(graph)
+    move = getattr(key, 'move', None)
+    unmove = getattr(key, 'unmove', None)
+    deadline = time.time() + time_limit if time_limit is not None else None
+    nodes = 0
+
+    def moves_to_try(vertex, visited):
+        moves = sorted(graph[vertex] - visited, key=key)
+        moves.reverse()
+        return moves
+
+    if starting_vertices is None:
+        starting_vertices = list(graph)
+    for starting_vertex in starting_vertices:
+        path = [starting_vertex]
+        visited = set(path)
+        if move:
+            move(starting_vertex)
+        stack = [moves_to_try(starting_vertex, visited)]
+
+        while stack:
+            if len(path) == total_squares:
+                return path
+
+            if not stack[-1]:
+                # dead end, so back up to the previous square
+                stack.pop()
+                vertex = path.pop()
+                visited.remove(vertex)
+                if unmove:
+                    unmove(vertex)
+                continue
+
+            nodes += 1
+            if max_nodes is not None and nodes > max_nodes:
+                raise SearchBudgetExceeded(
+                    'visited {} squares without finding a tour'.format(
+                        max_nodes), list(path))
+            if deadline is not None and nodes % 1024 == 0 and \
+                    time.time() > deadline:
+                raise SearchBudgetExceeded(
+                    'no tour found within {} seconds'.format(time_limit),
+                    list(path))
+
+            vertex = stack[-1].pop()
+            path.append(vertex)
+            visited.add(vertex)
+            if move:
+                move(vertex)
+            stack.append(moves_to_try(vertex, visited))
+
+    return None
+
+# find_solution_iteratively(8, warnsdorffs_heuristic)
+# => [(7, 3), (6, 1), (4, 0), (2, 1), (0, 0), (1, 2), ... ]
+
+"""
+Warnsdorff’s Heuristic, Revisited
+---
+
+Our `warnsdorffs_heuristic` ranks each square by the number of legal
+moves from it, but what Warnsdorff actually proposed was to rank squares
+by the number of moves from them to squares which have *not yet been
+visited*. As the tour progresses these two numbers diverge, and on large
+boards it is the second which keeps the knight from stranding itself.
+
+Recounting the unvisited neighbors of every candidate square at every
+step would be slow, so `RemainingDegreeHeuristic` instead keeps a count
+of the unvisited neighbors of every square, and updates it as the search
+moves. When the knight moves to a square, each of that square’s
+neighbors has one fewer unvisited neighbor; when the search backs up,
+each has one more. `find_solution_iteratively` calls the heuristic’s
+`move` and `unmove` methods to tell it about each of these steps, and
+otherwise uses it as a key function just like `warnsdorffs_heuristic`.
+The recursive `find_solution_for`, on the other hand, creates a fresh key
+function at every step and never calls these methods, so there the
+counts would never change; `RemainingDegreeHeuristic` is only meant for
+`find_solution_iteratively` and `find_solution_in_parallel`.
+
+Even with exact counts there are often several squares with the same
+count, and how we choose between them matters a great deal on large
+boards. Two tie breaking rules are provided:
+
+-   `'distance'`, following Arnd Roth, prefers the square farthest from
+    the center of the board; and
+-   `'lookahead'`, in the spirit of Ira Pohl’s refinement of the
+    heuristic, prefers the square whose unvisited neighbors themselves
+    have the fewest unvisited neighbors in total.
+
+We can also break ties at random with `'random'`, which, given different
+`seed` values, lets us try many different tours from the same square, or
+not at all with `None`.
+
+Starting from a corner, either rule finds tours of boards with thousands
+of squares without backing up at all, in time proportional to the number
+of squares. From other starting squares the `'distance'` rule, which is
+the default, is much less likely to lead the search astray.
+"""
+
+
+class RemainingDegreeHeuristic(object):
+    def __init__(self, graph, tie_break='distance', seed=None):
+        if tie_break not in ('distance', 'lookahead', 'random', None):
+            raise ValueError('unknown tie_break {!r}'.format(tie_break))
+        self.graph = graph
+        self.tie_break = tie_break
+        self.random = random.Random(seed)
+        self.remaining = {
+            vertex: len(neighbors) for vertex, neighbors in graph.items()}
+        self.visited = set()
+        if graph:
+            rows = [row for row, _ in graph]
+            cols = [col for _, col in graph]
+            self.center = ((min(rows) + max(rows)) / 2.0,
+                           (min(cols) + max(cols)) / 2.0)
+
+    def move(self, vertex):
+        self.visited.add(vertex)
+        for neighbor in self.graph[vertex]:
+            self.remaining[neighbor] -= 1
+
+    def unmove(self, vertex):
+        self.visited.remove(vertex)
+        for neighbor in self.graph[vertex]:
+            self.remaining[neighbor] += 1
+
+    def __call__(self, vertex):
+        if self.tie_break == 'lookahead':
+            return (self.remaining[vertex], sum(
+                self.remaining[neighbor] for neighbor in self.graph[vertex]
+                if neighbor not in self.visited))
+        if self.tie_break == 'distance':
+            row, col = vertex
+            center_row, center_col = self.center
+            return (self.remaining[vertex],
+                    -(row - center_row) ** 2 - (col - center_col) ** 2)
+        if self.tie_break == 'random':
+            return self.remaining[vertex], self.random.random()
+        return self.remaining[vertex]
+
+# find_solution_iteratively(
+#     100, RemainingDegreeHeuristic, starting_vertices=[(0, 0)])
+# => [(0, 0), (1, 2), (2, 0), (0, 1), (1, 3), (0, 5), ... ]
+
+"""
+Searching From Many Squares at Once
+---
+
+How long a search takes can depend enormously on the square it starts
+from, and on how ties are broken along the way; one starting square may
+lead straight to a tour while another leads into a long fruitless
+search. Rather than trying each possibility in turn, we can hand them out
+to a pool of processes and take whichever tour is found first.
+
+Each task names a starting square, a tie breaking rule and a seed for
+the `'random'` rule, so that different tasks explore different parts of
+the search space. As soon as one task returns a tour we terminate the
+pool, abandoning the searches still running. Giving each task a node or
+time budget makes sure that a hopeless search cannot hold up a process
+which could be trying something more promising. Unless told otherwise,
+each task may visit at most four times as many squares as there are on
+the board: a search guided by a good heuristic rarely needs to back up
+much, and a search which does is unlikely to recover.
+"""
+
+from multiprocessing import Pool
+
+
+def find_solution_in_parallel(board_size, tie_breaks=('distance', 'random'),
+                              seeds=(0,), processes=None, max_nodes=None,
+                              time_limit=None):
+    if max_nodes is None:
+        max_nodes = 4 * board_size * board_size
+    tasks = [
+        (board_size, starting_vertex, tie_break, seed, max_nodes, time_limit)
+        for starting_vertex in sorted(build_graph(board_size))
+        for tie_break in tie_breaks
+        for seed in (seeds if tie_break == 'random' else (None,))
+    ]
+
+    pool = Pool(processes)
+    try:
+        for tour in pool.imap_unordered(search_from, tasks):
+            if tour:
+                return tour
+    finally:
+        pool.terminate()
+        pool.join()
+    return None
+
+
+def search_from(task):
+    board_size, starting_vertex, tie_break, seed, max_nodes, time_limit = task
+
+    def heuristic(graph):
+        return RemainingDegreeHeuristic(graph, tie_break, seed)
+
+    try:
+        return find_solution_iteratively(
+            board_size, heuristic, max_nodes, time_limit, [starting_vertex])
+    except SearchBudgetExceeded:
+        return None
+
+# find_solution_in_parallel(8)
+# => [(0, 0), (1, 2), (2, 0), (0, 1), (1, 3), (0, 5), ... ]
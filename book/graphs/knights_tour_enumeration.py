@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+"""
+Finding one knight’s tour is one thing; finding *all* of them, or all of
+the **closed** tours, in which the last square is a knight’s move away
+from the first, is quite another. Even on a five-by-five board there are
+1,728 tours, and a search for all of them cannot stop at the first
+success, so it is worth working hard to avoid searching hopeless paths.
+
+We use the bitboards introduced in `find_solution_with_bitboard`, and
+before extending a path we check that it could still be completed. Every
+unvisited square must be entered and left again, except for the final
+square of the tour and the square we move to next, so:
+
+-   an unvisited square with no unvisited neighbors is a dead end, unless
+    it is the only square left;
+-   an unvisited square with just one unvisited neighbor must be the
+    final square of the tour, unless we can move to it next, so there can
+    be at most one such square; and
+-   the unvisited squares must all be connected to one another, or we
+    could never visit all of them.
+
+For tours which need not be closed we also make use of the symmetry of
+the board. Rotating or reflecting a tour gives another tour, so having
+found all of the tours from one square we can produce all of the tours
+from each of up to seven other squares simply by rotating and reflecting
+them. We only need to search from one square in each group of squares
+related by symmetry: a triangle making up an eighth of the board.
+
+A closed tour must pass through a corner square, and since a corner
+square only has two neighbors, the tour must arrive at the corner from
+one of them and leave by the other. So we find each closed tour exactly
+once by starting in the corner, moving first to one of its neighbors and
+finishing at the other.
+
+Tours are generated one at a time, so that we can count or examine
+millions of them without ever holding them all in memory.
+"""
+
+from knights_tour import count_squares, move_masks_for
+
+
+def symmetries_of(board_size):
+    last = board_size - 1
+    transforms = (
+        lambda row, col: (row, col),
+        lambda row, col: (col, last - row),
+        lambda row, col: (last - row, last - col),
+        lambda row, col: (last - col, row),
+        lambda row, col: (col, row),
+        lambda row, col: (row, last - col),
+        lambda row, col: (last - row, col),
+        lambda row, col: (last - col, last - row),
+    )
+    symmetries = []
+    for transform in transforms:
+        symmetry = []
+        for square in range(board_size * board_size):
+            row, col = transform(*divmod(square, board_size))
+            symmetry.append(row * board_size + col)
+        symmetries.append(symmetry)
+    return symmetries
+
+
+def enumerate_tours(board_size, closed=False, use_symmetry=True):
+    move_masks = move_masks_for(board_size)
+    total_squares = board_size * board_size
+
+    def as_coordinates(path):
+        return [divmod(square, board_size) for square in path]
+
+    if closed:
+        corner_moves = move_masks[0]
+        if total_squares == 1 or count_squares(corner_moves) != 2:
+            return
+        first = (corner_moves & -corner_moves).bit_length() - 1
+        last = (corner_moves & ~(1 << first)).bit_length() - 1
+        for path in hamiltonian_paths(move_masks, [0, first], last):
+            yield as_coordinates(path)
+        return
+
+    if not use_symmetry:
+        for square in range(total_squares):
+            for path in hamiltonian_paths(move_masks, [square]):
+                yield as_coordinates(path)
+        return
+
+    # search from the first square of each group, then map each tour to
+    # the other squares of the group by one symmetry apiece
+    symmetries = symmetries_of(board_size)
+    covered = set()
+    for square in range(total_squares):
+        if square in covered:
+            continue
+        images = {}
+        for symmetry in symmetries:
+            images.setdefault(symmetry[square], symmetry)
+        covered.update(images)
+        del images[square]
+
+        for path in hamiltonian_paths(move_masks, [square]):
+            yield as_coordinates(path)
+            for symmetry in images.values():
+                yield as_coordinates([symmetry[step] for step in path])
+
+
+def count_tours(board_size, closed=False):
+    return sum(1 for _ in enumerate_tours(board_size, closed))
+
+"""
+The search itself is the same iterative search as
+`find_solution_with_bitboard`, except that when it completes a path it
+yields a copy and then carries on searching, and that it only visits the
+square `end`, if one is given, as the very last square.
+"""
+
+
+def hamiltonian_paths(move_masks, start, end=None):
+    total_squares = len(move_masks)
+    path = [0] * total_squares
+    untried = [0] * total_squares
+    visited = 0
+    for depth, square in enumerate(start):
+        path[depth] = square
+        visited |= 1 << square
+    depth = len(start) - 1
+    if depth == total_squares - 1:
+        yield path[:]
+        return
+    end_bit = 0 if end is None else 1 << end
+    untried[depth] = move_masks[path[depth]] & ~visited
+    if not can_complete(move_masks, path[depth], visited, end):
+        return
+
+    while depth >= len(start) - 1:
+        moves = untried[depth]
+        if not moves:
+            visited &= ~(1 << path[depth])
+            depth -= 1
+            continue
+
+        bit = moves & -moves
+        untried[depth] ^= bit
+        if bit == end_bit and depth < total_squares - 2:
+            continue
+
+        square = bit.bit_length() - 1
+        depth += 1
+        path[depth] = square
+        visited |= bit
+        if depth == total_squares - 1:
+            if end is None or square == end:
+                yield path[:]
+            visited ^= bit
+            depth -= 1
+        elif can_complete(move_masks, square, visited, end):
+            untried[depth] = move_masks[square] & ~visited
+        else:
+            visited ^= bit
+            depth -= 1
+
+
+def can_complete(move_masks, current, visited, end=None):
+    unvisited = ((1 << len(move_masks)) - 1) & ~visited
+    if not unvisited:
+        return True
+    current_moves = move_masks[current]
+    if not current_moves & unvisited:
+        return False
+
+    loose_ends = 0
+    squares = unvisited
+    while squares:
+        bit = squares & -squares
+        squares ^= bit
+        square = bit.bit_length() - 1
+        degree = count_squares(move_masks[square] & unvisited)
+        if degree == 0:
+            return squares == 0 and bit == unvisited
+        if degree == 1 and square != end and not current_moves & bit:
+            loose_ends += 1
+            if end is not None or loose_ends > 1:
+                return False
+
+    # flood fill from one unvisited square to check they are all connected
+    reached = frontier = unvisited & -unvisited
+    while frontier:
+        spread = 0
+        while frontier:
+            bit = frontier & -frontier
+            frontier ^= bit
+            spread |= move_masks[bit.bit_length() - 1]
+        frontier = spread & unvisited & ~reached
+        reached |= frontier
+    return reached == unvisited
+
+# count_tours(5)  # => 1728
+# next(enumerate_tours(6, closed=True))
+# => [(0, 0), (1, 2), (0, 4), (2, 3), (0, 2), (1, 0), ... ]
@@ -0,0 +1,42 @@
+import unittest
+
+from knights_tour_enumeration import count_tours, enumerate_tours
+
+
+class TestCorrectness(unittest.TestCase):
+
+    def assert_valid_tour(self, board_size, tour):
+        self.assertEqual(board_size * board_size, len(set(tour)))
+        for v1, v2 in zip(tour[:-1], tour[1:]):
+            deltas = set([abs(v1[0] - v2[0]), abs(v1[1] - v2[1])])
+            self.assertSetEqual(deltas, set([1, 2]))
+
+    def test_small_boards(self):
+        self.assertEqual(count_tours(1), 1)
+        for board_size in range(2, 5):
+            self.assertEqual(count_tours(board_size), 0)
+            self.assertEqual(count_tours(board_size, closed=True), 0)
+
+    def test_size_five_board(self):
+        tours = list(enumerate_tours(5))
+        self.assertEqual(len(tours), 1728)
+        for tour in tours[:50]:
+            self.assert_valid_tour(5, tour)
+        self.assertEqual(set(tuple(tour) for tour in tours),
+                         set(tuple(tour) for tour in
+                             enumerate_tours(5, use_symmetry=False)))
+
+    def test_size_five_board_has_no_closed_tour(self):
+        self.assertEqual(count_tours(5, closed=True), 0)
+
+    def test_closed_tours(self):
+        tours = enumerate_tours(6, closed=True)
+        for _ in range(20):
+            tour = next(tours)
+            self.assert_valid_tour(6, tour)
+            self.assertEqual(tour[0], (0, 0))
+            self.assertIn(tour[-1], [(1, 2), (2, 1)])
+
+
+if __name__ == '__main__':
+    unittest.main()
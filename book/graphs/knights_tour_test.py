@@ -1,6 +1,10 @@
+from functools import partial
 import unittest
 
-from knights_tour import find_solution_for, warnsdorffs_heuristic
+from knights_tour import (
+    RemainingDegreeHeuristic, SearchBudgetExceeded, build_graph,
+    find_solution_for, find_solution_in_parallel, find_solution_iteratively,
+    find_solution_with_bitboard, warnsdorffs_heuristic)
 
 
 class TestCorrectness(unittest.TestCase):
@@ -8,7 +12,11 @@ class TestCorrectness(unittest.TestCase):
     def assert_valid_tour(self, board_size, tour):
         # tour is correct length
         self.assertEqual(board_size * board_size, len(set(tour)))
-        for v1, v2 in zip(tour[:-1], tour[1:]):
+        self.assert_valid_path(tour)
+
+    def assert_valid_path(self, path):
+        self.assertEqual(len(path), len(set(path)))
+        for v1, v2 in zip(path[:-1], path[1:]):
             deltas = set([abs(v1[0] - v2[0]), abs(v1[1] - v2[1])])
             # each step is a valid knights move
             self.assertSetEqual(deltas, set([1, 2]))
@@ -27,6 +35,77 @@ class TestCorrectness(unittest.TestCase):
         tour = find_solution_for(board_size, warnsdorffs_heuristic)
         self.assert_valid_tour(board_size, tour)
 
+    def test_bitboard_solutions(self):
+        for board_size in range(1, 5):
+            self.assertFalse(find_solution_with_bitboard(board_size))
+        self.assert_valid_tour(5, find_solution_with_bitboard(5, False))
+        for board_size in (5, 8, 32):
+            self.assert_valid_tour(
+                board_size, find_solution_with_bitboard(board_size))
+
+    def test_iterative_search_matches_recursive_search(self):
+        for board_size in range(1, 5):
+            self.assertFalse(find_solution_iteratively(board_size))
+        self.assertEqual(find_solution_iteratively(5), find_solution_for(5))
+        self.assertEqual(
+            find_solution_iteratively(8, warnsdorffs_heuristic),
+            find_solution_for(8, warnsdorffs_heuristic))
+
+    def test_iterative_search_respects_budgets(self):
+        self.assertRaises(SearchBudgetExceeded, find_solution_iteratively,
+                          6, max_nodes=1000)
+        self.assertRaises(SearchBudgetExceeded, find_solution_iteratively,
+                          6, time_limit=0)
+
+    def test_iterative_search_goes_deeper_than_recursion_limit(self):
+        try:
+            find_solution_iteratively(
+                40, warnsdorffs_heuristic, max_nodes=5000)
+        except SearchBudgetExceeded as exception:
+            self.assertGreater(len(exception.path), 1000)
+            self.assert_valid_path(exception.path)
+        else:
+            self.fail('expected the node budget to run out')
+
+    def test_remaining_degree_counts_follow_the_search(self):
+        graph = build_graph(5)
+        heuristic = RemainingDegreeHeuristic(graph)
+        self.assertEqual(heuristic((1, 2)), (6, -1))
+        heuristic.move((0, 0))
+        self.assertEqual(heuristic.remaining[(1, 2)], 5)
+        self.assertEqual(heuristic.remaining[(2, 1)], 5)
+        heuristic.unmove((0, 0))
+        self.assertEqual(heuristic.remaining, {
+            vertex: len(neighbors) for vertex, neighbors in graph.items()})
+
+    def test_rejects_unknown_tie_break(self):
+        self.assertRaises(ValueError, RemainingDegreeHeuristic,
+                          build_graph(5), 'lookahed')
+
+    def test_remaining_degree_heuristic_solves_large_boards(self):
+        for tie_break in ('distance', 'lookahead', None):
+            tour = find_solution_iteratively(
+                50, partial(RemainingDegreeHeuristic, tie_break=tie_break),
+                max_nodes=50 * 50, starting_vertices=[(0, 0)])
+            self.assert_valid_tour(50, tour)
+        tour = find_solution_iteratively(
+            100, RemainingDegreeHeuristic, max_nodes=2 * 100 * 100)
+        self.assert_valid_tour(100, tour)
+
+    def test_parallel_search(self):
+        for board_size in (3, 4):
+            self.assertFalse(find_solution_in_parallel(
+                board_size, processes=2, max_nodes=1000))
+        for board_size in (5, 8, 45):
+            tour = find_solution_in_parallel(
+                board_size, seeds=(0, 1), processes=2,
+                max_nodes=4 * board_size * board_size)
+            self.assert_valid_tour(board_size, tour)
+
+    def test_parallel_search_has_a_default_budget(self):
+        self.assertFalse(find_solution_in_parallel(4, processes=2))
+        self.assert_valid_tour(8, find_solution_in_parallel(8, processes=2))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+"""
+Prim’s algorithm grows a single tree outward from its starting vertex,
+so given a graph in several pieces it only spans the piece containing
+that vertex. Two other classic algorithms instead build a **minimum
+spanning forest**, with one minimum spanning tree for each connected
+piece of the graph, and each is faster than Prim’s algorithm on some
+kinds of graphs.
+
+Both work with a list of the edges of the graph rather than with the
+adjacency dictionaries directly. Since our undirected graphs store each
+edge once in each direction, `edge_arrays` numbers the vertices and
+keeps just one copy of each edge, leading from the lower numbered vertex
+to the higher numbered one, in three parallel arrays of sources, targets
+and weights. An edge stored in only one direction is kept all the same,
+and so is a vertex which only appears as a neighbor.
+
+Both functions return the forest in the same format as
+`create_spanning_tree`, a dictionary from each vertex to the set of its
+children, along with the total weight of the forest. Neither algorithm
+has a starting vertex to grow its trees from, so once the edges of the
+forest are chosen, `rooted_forest` roots each tree at whichever of its
+vertices comes first in the graph, and points every edge away from that
+root.
+"""
+
+from array import array
+from collections import defaultdict
+from multiprocessing import Pool, cpu_count
+from numbers import Integral
+
+from disjoint_set import DisjointSet
+
+
+def edge_arrays(graph):
+    vertices = list(graph)
+    ids = {vertex: i for i, vertex in enumerate(vertices)}
+    sources, targets, weights = array('l'), array('l'), []
+    seen = set()
+    for vertex in list(vertices):
+        i = ids[vertex]
+        for neighbor, weight in graph[vertex].items():
+            if neighbor not in ids:
+                ids[neighbor] = len(vertices)
+                vertices.append(neighbor)
+            j = ids[neighbor]
+            pair = (i, j) if i < j else (j, i)
+            if i != j and pair not in seen:
+                seen.add(pair)
+                sources.append(pair[0])
+                targets.append(pair[1])
+                weights.append(weight)
+    integral = all(isinstance(weight, Integral) for weight in weights)
+    return vertices, sources, targets, array('l' if integral else 'd', weights)
+
+
+def rooted_forest(vertices, sources, targets, tree_edges):
+    neighbors = defaultdict(list)
+    for edge in tree_edges:
+        neighbors[sources[edge]].append(targets[edge])
+        neighbors[targets[edge]].append(sources[edge])
+
+    forest = defaultdict(set)
+    visited = set()
+    for root in sorted(neighbors):
+        if root in visited:
+            continue
+        visited.add(root)
+        stack = [root]
+        while stack:
+            parent = stack.pop()
+            for child in neighbors[parent]:
+                if child not in visited:
+                    visited.add(child)
+                    forest[vertices[parent]].add(vertices[child])
+                    stack.append(child)
+    return forest
+
+"""
+Kruskal’s Algorithm
+---
+
+Kruskal’s algorithm considers the edges in order of increasing weight,
+adding each one to the forest unless it would join two vertices that
+are already connected. A `DisjointSet`, described below, tells us in
+effectively constant time whether two vertices are already connected,
+and joins them if not, so the running time of Kruskal’s algorithm is
+dominated by sorting the edges: $$O(E \log{E})$$.
+"""
+
+
+def kruskals_algorithm(graph):
+    vertices, sources, targets, weights = edge_arrays(graph)
+    tree_edges = []
+    total_weight = 0
+    components = DisjointSet(len(vertices))
+    for edge in sorted(range(len(weights)), key=weights.__getitem__):
+        if components.union(sources[edge], targets[edge]):
+            tree_edges.append(edge)
+            total_weight += weights[edge]
+    return rooted_forest(vertices, sources, targets, tree_edges), total_weight
+
+"""
+Borůvka’s Algorithm
+---
+
+The oldest of the three algorithms, published by Otakar Borůvka in 1926,
+works in rounds. In each round every component of the forest picks the
+cheapest edge leading out of it, and all of those edges are added at
+once, which at least halves the number of components. So there are at
+most $$\log_2{V}$$ rounds, each of which looks at every edge once.
+
+Within a round, the search for the cheapest edges can be split between
+processes, since each process can scan its own share of the edges
+independently and the main process need only pick the cheapest of the
+candidates they return for each component. As when building the word
+ladder graph in parallel, the edge arrays are given to each process once
+when it starts; at each round we send only the current component of each
+vertex. Edges of equal weight are compared by their position in the
+arrays, so that every component agrees on which of them is cheapest and
+no cycle can form.
+
+Pass `processes=None` to use one process per CPU; with the default of a
+single process, no other processes are started.
+"""
+
+
+def boruvkas_algorithm(graph, processes=1):
+    vertices, sources, targets, weights = edge_arrays(graph)
+    tree_edges = []
+    total_weight = 0
+    components = DisjointSet(len(vertices))
+    labels = array('l', range(len(vertices)))
+
+    pool = None
+    if processes == 1:
+        share_edges(sources, targets, weights)
+    else:
+        pool = Pool(processes, share_edges, (sources, targets, weights))
+        chunk_size = len(weights) // (4 * (processes or cpu_count())) + 1
+    try:
+        while True:
+            if pool is None:
+                candidates = [cheapest_edges((labels, 0, len(weights)))]
+            else:
+                candidates = pool.imap_unordered(cheapest_edges, [
+                    (labels, start, start + chunk_size)
+                    for start in range(0, len(weights), chunk_size)])
+
+            cheapest = {}
+            for chunk in candidates:
+                for component, edge in chunk.items():
+                    best = cheapest.get(component)
+                    if best is None or \
+                            (weights[edge], edge) < (weights[best], best):
+                        cheapest[component] = edge
+            if not cheapest:
+                break
+
+            for edge in set(cheapest.values()):
+                if components.union(sources[edge], targets[edge]):
+                    tree_edges.append(edge)
+                    total_weight += weights[edge]
+            for i in range(len(labels)):
+                labels[i] = components.find(i)
+    except BaseException:
+        if pool is not None:
+            pool.terminate()
+        raise
+    else:
+        if pool is not None:
+            pool.close()
+    finally:
+        if pool is None:
+            # don't keep the edge arrays alive once we are done with them
+            share_edges(None, None, None)
+        else:
+            pool.join()
+    return rooted_forest(vertices, sources, targets, tree_edges), total_weight
+
+
+shared_edges = None
+
+
+def share_edges(sources, targets, weights):
+    global shared_edges
+    shared_edges = sources, targets, weights
+
+
+def cheapest_edges(task):
+    labels, start, end = task
+    sources, targets, weights = shared_edges
+    cheapest = {}
+    for edge in range(start, min(end, len(weights))):
+        a, b = labels[sources[edge]], labels[targets[edge]]
+        if a == b:
+            continue
+        weight = weights[edge]
+        for component in (a, b):
+            best = cheapest.get(component)
+            if best is None or weight < weights[best]:
+                cheapest[component] = edge
+    return cheapest
+
+example_graph = {
+    'A': {'B': 2, 'C': 3},
+    'B': {'A': 2, 'C': 1, 'D': 1, 'E': 4},
+    'C': {'A': 3, 'B': 1, 'F': 5},
+    'D': {'B': 1, 'E': 1},
+    'E': {'B': 4, 'D': 1, 'F': 1},
+    'F': {'C': 5, 'E': 1, 'G': 1},
+    'G': {'F': 1},
+    'X': {'Y': 7},
+    'Y': {'X': 7},
+}
+
+# kruskals_algorithm(example_graph)
+# => ({'A': {'B'}, 'B': {'C', 'D'}, 'D': {'E'}, 'E': {'F'}, 'F': {'G'},
+#      'X': {'Y'}}, 14)
@@ -0,0 +1,120 @@
+import unittest
+
+from disjoint_set import DisjointSet, connected_components
+import minimum_spanning_forest
+from minimum_spanning_forest import (
+    boruvkas_algorithm, edge_arrays, example_graph, kruskals_algorithm)
+from prims_spanning_tree import create_spanning_tree
+from random_graphs import random_graph
+
+expected_forest = {
+    'A': set(['B']),
+    'B': set(['C', 'D']),
+    'D': set(['E']),
+    'E': set(['F']),
+    'F': set(['G']),
+    'X': set(['Y']),
+}
+
+
+def undirected_edges(forest):
+    return set(frozenset((a, b)) for a in forest for b in forest[a])
+
+
+def tree_weight(graph, forest):
+    return sum(graph[a][b] for a in forest for b in forest[a])
+
+
+class TestCorrectness(unittest.TestCase):
+
+    def assert_spanning_forest(self, graph, forest):
+        # a forest has one fewer edge than vertices in each component
+        vertices, components = connected_components(graph)
+        ids = {vertex: i for i, vertex in enumerate(vertices)}
+        joined = DisjointSet(len(vertices))
+        for a in forest:
+            for b in forest[a]:
+                self.assertIn(b, graph[a])
+                self.assertTrue(joined.union(ids[a], ids[b]))
+        self.assertEqual(joined.count, len(set(components)))
+
+        # each tree is rooted at the first of its vertices in the graph,
+        # and every other vertex has exactly one parent
+        children = [b for a in forest for b in forest[a]]
+        self.assertEqual(len(children), len(set(children)))
+        roots = {}
+        for vertex, component in zip(vertices, components):
+            roots.setdefault(component, vertex)
+        self.assertEqual(set(children), set(graph) - set(roots.values()))
+
+    def test_example_graph(self):
+        for algorithm in (kruskals_algorithm, boruvkas_algorithm):
+            forest, total_weight = algorithm(example_graph)
+            self.assertEqual(undirected_edges(forest),
+                             undirected_edges(expected_forest))
+            self.assert_spanning_forest(example_graph, forest)
+            self.assertEqual(total_weight, 14)
+
+    def test_agrees_with_prims_algorithm(self):
+        graph = random_graph(200, 1000, max_weight=20)
+        graph[0][1] = graph[1][0] = 1
+        for vertex in range(1, 200):
+            graph[vertex - 1][vertex] = graph[vertex][vertex - 1] = 50
+        prims_weight = tree_weight(graph, create_spanning_tree(graph, 0))
+        for algorithm in (kruskals_algorithm, boruvkas_algorithm):
+            forest, total_weight = algorithm(graph)
+            self.assert_spanning_forest(graph, forest)
+            self.assertEqual(total_weight, prims_weight)
+            self.assertEqual(tree_weight(graph, forest), total_weight)
+
+    def test_disconnected_graph_with_equal_weights(self):
+        graph = random_graph(300, 250, max_weight=20, seed=1,
+                             connected=False)
+        for vertex in graph:
+            for neighbor in graph[vertex]:
+                graph[vertex][neighbor] = 1
+        for algorithm in (kruskals_algorithm, boruvkas_algorithm):
+            forest, total_weight = algorithm(graph)
+            self.assert_spanning_forest(graph, forest)
+
+    def test_boruvka_releases_shared_edges(self):
+        boruvkas_algorithm(example_graph)
+        self.assertEqual(minimum_spanning_forest.shared_edges,
+                         (None, None, None))
+
+    def test_boruvka_in_parallel(self):
+        graph = random_graph(500, 3000, max_weight=20, seed=2)
+        forest, total_weight = boruvkas_algorithm(graph, processes=2)
+        self.assert_spanning_forest(graph, forest)
+        self.assertEqual(total_weight, kruskals_algorithm(graph)[1])
+
+    def test_float_weights(self):
+        graph = {'A': {'B': 0.5, 'C': 1.5}, 'B': {'A': 0.5, 'C': 0.25},
+                 'C': {'A': 1.5, 'B': 0.25}}
+        for algorithm in (kruskals_algorithm, boruvkas_algorithm):
+            self.assertEqual(algorithm(graph)[1], 0.75)
+
+    def test_long_weights_are_integral(self):
+        # a long in Python 2
+        one = (1 << 64) >> 64
+        _, _, _, weights = edge_arrays({'A': {'B': one}, 'B': {'A': one}})
+        self.assertEqual(weights.typecode, 'l')
+
+    def test_edges_stored_in_one_direction(self):
+        graph = {'A': {'B': 1, 'C': 5}, 'B': {'C': 2}, 'C': {}}
+        for algorithm in (kruskals_algorithm, boruvkas_algorithm):
+            forest, total_weight = algorithm(graph)
+            self.assertEqual(total_weight, 3)
+            self.assertEqual(undirected_edges(forest),
+                             set([frozenset('AB'), frozenset('BC')]))
+
+    def test_vertices_only_seen_as_neighbors(self):
+        graph = {'A': {'B': 1, 'C': 4}, 'B': {'A': 1, 'C': 2}}
+        for algorithm in (kruskals_algorithm, boruvkas_algorithm):
+            forest, total_weight = algorithm(graph)
+            self.assertEqual(total_weight, 3)
+            self.assertIn('C', forest['B'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,3 +1,4 @@
+# -*- coding: utf-8 -*-
 from collections import defaultdict
 import heapq
 
@@ -39,3 +40,75 @@ dict(create_spanning_tree(example_graph, 'A'))
 #  'D': set(['E']),
 #  'E': set(['F']),
 #  'F': set(['G'])}
+
+"""
+Prim’s Algorithm with Decrease-Key
+---
+
+`create_spanning_tree` pushes an entry onto the heap for every edge
+leading out of the tree, and on a dense graph most of those entries are
+stale by the time they reach the front: their vertex has long since
+joined the tree by a cheaper edge. The heap holds $$O(E)$$ entries, and
+we pay to push and pop every one of them.
+
+As with `calculate_distances_with_decrease_key` in the section on
+Dijkstra’s algorithm, an `IndexedPriorityQueue` lets us keep just one
+entry per vertex: the cheapest edge known so far connecting it to the
+tree. When we find a cheaper edge we lower the vertex’s priority in
+place, so the queue never holds more than $$V$$ entries.
+
+Rather than a dictionary of sets, this version returns three parallel
+sequences. `vertices` lists the vertices in the order they joined the
+tree; `parents[i]` is the position in `vertices` of the vertex that
+`vertices[i]` is joined to, or `-1` for the starting vertex; and
+`weights[i]` is the weight of that edge. Like the tree itself, these
+take $$O(V)$$ space.
+"""
+
+from array import array
+
+from indexed_priority_queue import IndexedPriorityQueue
+
+
+def create_spanning_tree_with_decrease_key(graph, starting_vertex):
+    vertices, parents, weights = [], array('l'), []
+    index = {}
+    closest = {starting_vertex: None}
+    queue = IndexedPriorityQueue()
+    queue.push(starting_vertex, 0)
+
+    while queue:
+        cost, vertex = queue.pop()
+        frm = closest.pop(vertex)
+        index[vertex] = len(vertices)
+        vertices.append(vertex)
+        parents.append(-1 if frm is None else index[frm])
+        weights.append(cost)
+        for to, cost in graph[vertex].items():
+            if to in index:
+                continue
+            if to not in queue:
+                queue.push(to, cost)
+                closest[to] = vertex
+            elif cost < queue.priority(to):
+                queue.decrease_key(to, cost)
+                closest[to] = vertex
+
+    integral = all(isinstance(weight, int) for weight in weights)
+    return vertices, parents, array('l' if integral else 'd', weights)
+
+
+def tree_from_parents(vertices, parents):
+    mst = defaultdict(set)
+    for vertex, parent in zip(vertices, parents):
+        if parent != -1:
+            mst[vertices[parent]].add(vertex)
+    return mst
+
+# vertices, parents, weights = \
+#     create_spanning_tree_with_decrease_key(example_graph, 'A')
+# => (['A', 'B', 'C', 'D', 'E', 'F', 'G'],
+#     array('l', [-1, 0, 1, 1, 3, 4, 5]),
+#     array('l', [0, 2, 1, 1, 1, 1, 1]))
+# tree_from_parents(vertices, parents) == create_spanning_tree(
+#     example_graph, 'A')
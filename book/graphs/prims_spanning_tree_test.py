@@ -1,6 +1,9 @@
+import random
 import unittest
 
-from prims_spanning_tree import create_spanning_tree, example_graph
+from prims_spanning_tree import (
+    create_spanning_tree, create_spanning_tree_with_decrease_key,
+    example_graph, tree_from_parents)
 
 expected_tree = {
     'A': set(['B']),
@@ -18,3 +21,35 @@ class TestCorrectness(unittest.TestCase):
             create_spanning_tree(example_graph, 'A'),
             expected_tree
         )
+
+    def test_decrease_key_example_graph(self):
+        vertices, parents, weights = \
+            create_spanning_tree_with_decrease_key(example_graph, 'A')
+        self.assertEqual(tree_from_parents(vertices, parents), expected_tree)
+        self.assertEqual(vertices[0], 'A')
+        self.assertEqual(sum(weights), 7)
+        for vertex, parent, weight in zip(vertices, parents, weights):
+            if parent != -1:
+                self.assertEqual(example_graph[vertices[parent]][vertex],
+                                 weight)
+
+    def test_decrease_key_matches_lazy_version(self):
+        rng = random.Random(0)
+        graph = {vertex: {} for vertex in range(300)}
+        for vertex in range(1, 300):
+            graph[vertex - 1][vertex] = graph[vertex][vertex - 1] = 100
+        for _ in range(3000):
+            a, b = rng.sample(range(300), 2)
+            graph[a][b] = graph[b][a] = rng.random()
+        lazy_tree = create_spanning_tree(graph, 0)
+        lazy_weight = sum(graph[a][b] for a in lazy_tree for b in lazy_tree[a])
+        vertices, parents, weights = \
+            create_spanning_tree_with_decrease_key(graph, 0)
+        self.assertEqual(len(vertices), 300)
+        self.assertAlmostEqual(sum(weights), lazy_weight)
+        self.assertEqual(tree_from_parents(vertices, parents), lazy_tree)
+
+    def test_spans_only_the_starting_component(self):
+        graph = dict(example_graph, X={'Y': 1}, Y={'X': 1})
+        vertices, _, _ = create_spanning_tree_with_decrease_key(graph, 'X')
+        self.assertEqual(sorted(vertices), ['X', 'Y'])
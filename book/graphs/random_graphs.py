@@ -0,0 +1,61 @@
+"""
+Random graphs for the tests and benchmarks in this chapter. Each is built
+from its own seeded random number generator, so that a given seed always
+produces the same graph.
+"""
+
+import random
+
+
+def random_graph(vertex_count, edge_count, max_weight=100, seed=0,
+                 connected=True):
+    # a random, undirected graph in our dict-of-dicts format; unless asked
+    # otherwise it is built around a ring so that every vertex is reachable
+    rng = random.Random(seed)
+    graph = {vertex: {} for vertex in range(vertex_count)}
+
+    def add_edge(a, b):
+        weight = rng.randint(1, max_weight)
+        graph[a][b] = weight
+        graph[b][a] = weight
+
+    edges = 0
+    if connected:
+        for vertex in range(vertex_count):
+            add_edge(vertex, (vertex + 1) % vertex_count)
+        edges = vertex_count
+    while edges < edge_count:
+        a, b = rng.randrange(vertex_count), rng.randrange(vertex_count)
+        if a != b and b not in graph[a]:
+            add_edge(a, b)
+            edges += 1
+    return graph
+
+
+def random_digraph(vertex_count, edge_count, max_weight=20, seed=0):
+    # a random, directed graph in our dict-of-dicts format, with no
+    # self-loops and at most one edge from any vertex to another
+    rng = random.Random(seed)
+    graph = {vertex: {} for vertex in range(vertex_count)}
+    edges = 0
+    while edges < edge_count:
+        a, b = rng.randrange(vertex_count), rng.randrange(vertex_count)
+        if a != b and b not in graph[a]:
+            graph[a][b] = rng.randint(1, max_weight)
+            edges += 1
+    return graph
+
+
+def random_dag(vertex_count, edge_count, seed=0):
+    # edges only lead from earlier to later vertices in the list of labels,
+    # which is shuffled so that the dictionary order is no help; most edges
+    # are short, so that the graph has a long topological order
+    rng = random.Random(seed)
+    labels = list(range(vertex_count))
+    rng.shuffle(labels)
+    graph = {label: set() for label in labels}
+    for _ in range(edge_count):
+        a = rng.randrange(vertex_count - 1)
+        b = min(vertex_count - 1, a + 1 + int(rng.expovariate(0.01)))
+        graph[labels[a]].add(labels[b])
+    return graph, labels
@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+"""
+Here is the algorithm above, which is due to S. Rao Kosaraju, written
+using the `depth_first_forest` from the depth first search section, so
+that it copes with graphs far too deep to search recursively. The
+example graph is the one with three strongly connected components shown
+at the start of this section.
+
+Rather than a list of sets, we return the vertices in a list along with
+a compact array holding the number of the component of each vertex, so
+the vertex `vertices[i]` belongs to component `components[i]`. The
+components are numbered in the order the second search finds them. This
+turns out to be a topological order: there can be edges from a
+component to components with higher numbers, but never to components
+with lower ones.
+"""
+
+from array import array
+from collections import defaultdict
+
+from depth_first_search import depth_first_forest
+
+example_graph = {
+    'A': ['B'],
+    'B': ['C', 'E'],
+    'C': ['C', 'F'],
+    'D': ['B', 'G'],
+    'E': ['A', 'D'],
+    'F': ['H'],
+    'G': ['E'],
+    'H': ['I'],
+    'I': ['F'],
+}
+
+
+def kosarajus_algorithm(graph):
+    forest = depth_first_forest(graph)
+
+    transpose = defaultdict(list)
+    for vertex in forest.vertices:
+        if vertex in graph:
+            for neighbor in graph[vertex]:
+                transpose[neighbor].append(vertex)
+
+    by_finish = sorted(range(len(forest)), key=forest.finish.__getitem__,
+                       reverse=True)
+    trees = depth_first_forest(
+        transpose, [forest.vertices[i] for i in by_finish])
+
+    # parents are always discovered before their children, so a single
+    # pass copies each tree's component number down to its vertices
+    components = array('l', [0]) * len(trees)
+    count = 0
+    for i, parent in enumerate(trees.parent):
+        if parent == -1:
+            components[i] = count
+            count += 1
+        else:
+            components[i] = components[parent]
+    return trees.vertices, components
+
+# kosarajus_algorithm(example_graph)
+# => (['A', 'E', 'B', 'D', 'G', 'C', 'F', 'I', 'H'],
+#     array('l', [0, 0, 0, 0, 0, 1, 2, 2, 2]))
+
+"""
+Tarjan’s Algorithm
+---
+
+Kosaraju’s algorithm searches the graph twice and builds its transpose
+in between. Robert Tarjan’s algorithm finds the components in a single
+search, at the cost of a little more bookkeeping. Vertices are numbered
+in the order the search discovers them, and each vertex also records a
+**low link**: the lowest number of any vertex still waiting to be
+assigned to a component that can be reached from it through its
+descendants in the depth first tree.
+
+Every discovered vertex waits on a stack until its component is known.
+When the search finishes a vertex whose low link is its own number, no
+vertex below it in the tree can reach any vertex above it, so that
+vertex and everything above it on the stack form a component. A vertex
+which has been discovered but not yet assigned a component is exactly a
+vertex on the stack, so the `components` array, with `-1` for “not yet
+assigned”, is the only record of it we need.
+
+The search uses the same explicit stack of neighbor iterators as
+`depth_first_forest`, with the low link of a finished vertex passed up
+to its parent when it is popped. Tarjan’s algorithm completes components
+in *reverse* topological order, so we renumber them at the end to match
+the numbering from Kosaraju’s algorithm.
+"""
+
+
+def tarjans_algorithm(graph):
+    index = {}
+    vertices = []
+    low_link = array('l')
+    components = array('l')
+    waiting = []
+    count = 0
+
+    for root in graph:
+        if root in index:
+            continue
+        i = index[root] = len(vertices)
+        vertices.append(root)
+        low_link.append(i)
+        components.append(-1)
+        waiting.append(i)
+        stack = [(i, iter(graph[root]))]
+
+        while stack:
+            i, neighbors = stack[-1]
+            for neighbor in neighbors:
+                if neighbor not in index:
+                    j = index[neighbor] = len(vertices)
+                    vertices.append(neighbor)
+                    low_link.append(j)
+                    components.append(-1)
+                    waiting.append(j)
+                    stack.append((j, iter(
+                        graph[neighbor] if neighbor in graph else ())))
+                    break
+                j = index[neighbor]
+                if components[j] == -1 and j < low_link[i]:
+                    low_link[i] = j
+            else:
+                stack.pop()
+                if stack:
+                    parent = stack[-1][0]
+                    if low_link[i] < low_link[parent]:
+                        low_link[parent] = low_link[i]
+                if low_link[i] == i:
+                    while True:
+                        j = waiting.pop()
+                        components[j] = count
+                        if j == i:
+                            break
+                    count += 1
+
+    for i in range(len(components)):
+        components[i] = count - 1 - components[i]
+    return vertices, components
+
+"""
+The Condensation
+---
+
+Finally, `condensation` builds the simplified graph shown earlier, in
+which each component becomes a single vertex, numbered as above, with an
+edge wherever the original graph has an edge between two different
+components. The condensation of any graph is a directed acyclic graph,
+and with either numbering its vertices are already topologically sorted.
+"""
+
+
+def condensation(graph, vertices, components):
+    component_of = dict(zip(vertices, components))
+    condensed = {component: set() for component in set(components)}
+    for vertex in vertices:
+        if vertex in graph:
+            component = component_of[vertex]
+            for neighbor in graph[vertex]:
+                if component_of[neighbor] != component:
+                    condensed[component].add(component_of[neighbor])
+    return condensed
+
+# condensation(example_graph, *tarjans_algorithm(example_graph))
+# => {0: {1}, 1: {2}, 2: set()}
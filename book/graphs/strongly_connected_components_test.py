@@ -0,0 +1,71 @@
+import unittest
+
+from random_graphs import random_digraph
+from strongly_connected_components import (
+    condensation, example_graph, kosarajus_algorithm, tarjans_algorithm)
+from topological_sort import topological_sort
+
+
+def as_partition(vertices, components):
+    partition = {}
+    for vertex, component in zip(vertices, components):
+        partition.setdefault(component, set()).add(vertex)
+    return partition
+
+
+class TestCorrectness(unittest.TestCase):
+
+    def assert_topologically_numbered(self, graph, vertices, components):
+        component_of = dict(zip(vertices, components))
+        for vertex in graph:
+            for neighbor in graph[vertex]:
+                self.assertLessEqual(component_of[vertex],
+                                     component_of[neighbor])
+
+    def test_example_graph(self):
+        expected = {0: set('ABDEG'), 1: set('C'), 2: set('FHI')}
+        for algorithm in (kosarajus_algorithm, tarjans_algorithm):
+            vertices, components = algorithm(example_graph)
+            self.assertEqual(as_partition(vertices, components), expected)
+            self.assertEqual(condensation(example_graph, vertices, components),
+                             {0: set([1]), 1: set([2]), 2: set()})
+
+    def test_algorithms_agree(self):
+        for seed in range(5):
+            graph = random_digraph(300, 400, seed=seed)
+            graph[seed][seed] = 1
+            kosaraju = kosarajus_algorithm(graph)
+            tarjan = tarjans_algorithm(graph)
+            self.assertEqual(
+                sorted(map(sorted, as_partition(*kosaraju).values())),
+                sorted(map(sorted, as_partition(*tarjan).values())))
+            for vertices, components in (kosaraju, tarjan):
+                self.assertEqual(set(vertices), set(graph))
+                self.assert_topologically_numbered(
+                    graph, vertices, components)
+                condensed = condensation(graph, vertices, components)
+                self.assertEqual(len(topological_sort(condensed)),
+                                 len(set(components)))
+
+    def test_sink_vertices_missing_from_graph(self):
+        graph = {'A': ['B'], 'B': ['A', 'C']}
+        for algorithm in (kosarajus_algorithm, tarjans_algorithm):
+            vertices, components = algorithm(graph)
+            self.assertEqual(as_partition(vertices, components),
+                             {0: set('AB'), 1: set('C')})
+
+    def test_long_cycle_does_not_overflow_the_stack(self):
+        length = 10 ** 5
+        graph = {i: [(i + 1) % length] for i in range(length)}
+        graph[length - 1].append(length)
+        for algorithm in (kosarajus_algorithm, tarjans_algorithm):
+            vertices, components = algorithm(graph)
+            self.assertEqual(len(vertices), length + 1)
+            self.assertEqual(
+                sorted(len(component) for component
+                       in as_partition(vertices, components).values()),
+                [1, length])
+
+
+if __name__ == '__main__':
+    unittest.main()
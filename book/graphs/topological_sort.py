@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+"""
+In code, the steps above need very little beyond the
+`depth_first_forest` from the previous section. A vertex is only
+finished once everything reachable from it has been finished, so listing
+the vertices in decreasing order of finish time puts every vertex ahead
+of all of the vertices it has edges to. We use the same adjacency format
+as `simple_graph`: a dictionary from each vertex to a list (or set) of
+the vertices it has edges to, where vertices with no outgoing edges may
+be left out.
+
+A graph with a cycle has no topological ordering, and the depth first
+search tells us when we have one: the cycle shows up as a **back edge**.
+Rather than return a meaningless order, we raise a `CycleError` whose
+`cycle` attribute lists the vertices of one of the cycles, beginning and
+ending with the same vertex, which we find by following the parent links
+in the forest from one end of the back edge to the other.
+"""
+
+from collections import defaultdict, deque
+
+from depth_first_search import BACK_EDGE, depth_first_forest
+
+
+class CycleError(ValueError):
+    def __init__(self, cycle):
+        ValueError.__init__(self, 'graph has a cycle: {}'.format(
+            ' -> '.join(repr(vertex) for vertex in cycle)))
+        self.cycle = cycle
+
+
+def topological_sort(graph):
+    forest = depth_first_forest(graph)
+    cycle = find_cycle(graph, forest)
+    if cycle is not None:
+        raise CycleError(cycle)
+    order = sorted(range(len(forest)), key=forest.finish.__getitem__,
+                   reverse=True)
+    return [forest.vertices[i] for i in order]
+
+
+def find_cycle(graph, forest=None):
+    if forest is None:
+        forest = depth_first_forest(graph)
+    for u, v, edge_class in forest.classified_edges():
+        if edge_class == BACK_EDGE:
+            cycle = [u]
+            while cycle[-1] != v:
+                cycle.append(forest.vertices[forest.parent[
+                    forest.index[cycle[-1]]]])
+            cycle.reverse()
+            cycle.append(v)
+            return cycle
+    return None
+
+pancakes = {
+    '3/4 cup milk': ['1 cup mix'],
+    '1 egg': ['1 cup mix'],
+    '1 Tbl Oil': ['1 cup mix'],
+    '1 cup mix': ['pour 1/4 cup', 'heat syrup'],
+    'heat griddle': ['pour 1/4 cup'],
+    'pour 1/4 cup': ['turn when bubbly'],
+    'turn when bubbly': ['eat'],
+    'heat syrup': ['eat'],
+}
+
+# topological_sort(pancakes)
+# => e.g. ['heat griddle', '1 egg', '1 Tbl Oil', '3/4 cup milk',
+#          '1 cup mix', 'heat syrup', 'pour 1/4 cup', 'turn when bubbly',
+#          'eat']
+
+"""
+Kahn’s Algorithm
+---
+
+The depth first approach cannot tell us which vertex comes first until
+it has searched the whole graph. An older algorithm, due to Arthur Kahn,
+works from the other end: a vertex with no incoming edges (an
+**in-degree** of zero) can safely go first. Once we have output it, we
+remove its outgoing edges by decrementing the in-degree of each of its
+neighbors, and any neighbor whose in-degree drops to zero can go next.
+
+Written as a generator, this lets us start on the first steps of a long
+schedule while the rest is still being sorted. If some vertices are
+never output, every one of them still has an incoming edge from another,
+so they must contain a cycle, which we find with `find_cycle` and report
+as before. Note that this can only happen after the vertices that *can*
+be ordered have all been produced.
+"""
+
+
+def kahns_topological_sort(graph):
+    in_degree = defaultdict(int)
+    for vertex in graph:
+        in_degree[vertex] += 0
+        for neighbor in graph[vertex]:
+            in_degree[neighbor] += 1
+
+    ready = deque(vertex for vertex, degree in in_degree.items()
+                  if degree == 0)
+    produced = 0
+    while ready:
+        vertex = ready.popleft()
+        yield vertex
+        produced += 1
+        for neighbor in graph[vertex] if vertex in graph else ():
+            in_degree[neighbor] -= 1
+            if in_degree[neighbor] == 0:
+                ready.append(neighbor)
+
+    if produced < len(in_degree):
+        remaining = {
+            vertex: [neighbor for neighbor in graph[vertex]
+                     if in_degree[neighbor] > 0]
+            for vertex in graph if in_degree[vertex] > 0
+        }
+        raise CycleError(find_cycle(remaining))
+
+"""
+Maintaining an Order as Edges are Added
+---
+
+When a graph such as a build’s dependency graph changes by an edge at a
+time, sorting it from scratch after every change is wasteful, since most
+new edges already agree with the existing order. The **Pearce–Kelly**
+algorithm repairs the order only where it must. Each vertex has a
+position in the order; a new edge $$(u, v)$$ where $$u$$ already comes
+before $$v$$ needs no work at all. Otherwise only the vertices positioned
+between $$v$$ and $$u$$ can be affected:
+
+-   we search forward from $$v$$ for the vertices it reaches that are
+    positioned no later than $$u$$ (if one of them is $$u$$ itself, the
+    new edge would create a cycle);
+-   we search backward from $$u$$ for the vertices that reach it that
+    are positioned no earlier than $$v$$; and
+-   we reuse the positions that these two groups of vertices occupy,
+    placing all of the backward group before all of the forward group,
+    keeping their relative order within each group.
+
+The cost depends on the size of the affected region rather than on the
+size of the graph.
+"""
+
+
+class IncrementalTopologicalOrder(object):
+    def __init__(self, graph=None):
+        self.successors = defaultdict(set)
+        self.predecessors = defaultdict(set)
+        self.order = []
+        self.position = {}
+        if graph is not None:
+            for vertex in topological_sort(graph):
+                self.add_vertex(vertex)
+            for vertex in graph:
+                for neighbor in graph[vertex]:
+                    self.successors[vertex].add(neighbor)
+                    self.predecessors[neighbor].add(vertex)
+
+    def __len__(self):
+        return len(self.order)
+
+    def __iter__(self):
+        return iter(self.order)
+
+    def add_vertex(self, vertex):
+        if vertex not in self.position:
+            self.position[vertex] = len(self.order)
+            self.order.append(vertex)
+
+    def add_edge(self, u, v):
+        self.add_vertex(u)
+        self.add_vertex(v)
+        position = self.position
+        if position[u] > position[v] or u == v:
+            lower, upper = position[v], position[u]
+            forward = self._search(v, self.successors, lower, upper)
+            if u in forward:
+                cycle = [u]
+                while cycle[-1] != v:
+                    cycle.append(forward[cycle[-1]])
+                cycle.reverse()
+                raise CycleError([u] + cycle)
+            backward = self._search(u, self.predecessors, lower, upper)
+            self._reorder(sorted(backward, key=position.__getitem__) +
+                          sorted(forward, key=position.__getitem__))
+        self.successors[u].add(v)
+        self.predecessors[v].add(u)
+
+    def remove_edge(self, u, v):
+        self.successors[u].discard(v)
+        self.predecessors[v].discard(u)
+
+    def _search(self, start, edges, lower, upper):
+        # returns the vertices reached without leaving the positions from
+        # lower to upper, mapped to the vertex they were reached from
+        position = self.position
+        reached = {start: None}
+        stack = [start]
+        while stack:
+            vertex = stack.pop()
+            for neighbor in edges[vertex]:
+                if neighbor not in reached and \
+                        lower <= position[neighbor] <= upper:
+                    reached[neighbor] = vertex
+                    stack.append(neighbor)
+        return reached
+
+    def _reorder(self, vertices):
+        slots = sorted(self.position[vertex] for vertex in vertices)
+        for slot, vertex in zip(slots, vertices):
+            self.position[vertex] = slot
+            self.order[slot] = vertex
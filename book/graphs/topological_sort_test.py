@@ -0,0 +1,91 @@
+import random
+import unittest
+
+from random_graphs import random_dag
+from topological_sort import (
+    CycleError, IncrementalTopologicalOrder, kahns_topological_sort,
+    pancakes, topological_sort)
+
+
+class TestCorrectness(unittest.TestCase):
+
+    def assert_topological_order(self, graph, order):
+        position = {vertex: i for i, vertex in enumerate(order)}
+        self.assertEqual(len(position), len(order))
+        for vertex in graph:
+            for neighbor in graph[vertex]:
+                self.assertLess(position[vertex], position[neighbor])
+
+    def assert_cycle(self, graph, cycle):
+        self.assertEqual(cycle[0], cycle[-1])
+        for u, v in zip(cycle[:-1], cycle[1:]):
+            self.assertIn(v, graph[u])
+
+    def test_sorts_pancakes(self):
+        for sort in (topological_sort, kahns_topological_sort):
+            order = list(sort(pancakes))
+            self.assertEqual(len(order), 9)
+            self.assert_topological_order(pancakes, order)
+
+    def test_sorts_random_dag(self):
+        graph, _ = random_dag(500, 2000)
+        for sort in (topological_sort, kahns_topological_sort):
+            order = list(sort(graph))
+            self.assertEqual(set(order), set(graph))
+            self.assert_topological_order(graph, order)
+
+    def test_reports_cycles(self):
+        graph = {'A': ['B'], 'B': ['C', 'D'], 'C': ['E'], 'D': ['A'],
+                 'E': []}
+        for sort in (topological_sort, kahns_topological_sort):
+            with self.assertRaises(CycleError) as context:
+                list(sort(graph))
+            self.assert_cycle(graph, context.exception.cycle)
+            self.assertEqual(set(context.exception.cycle), set('ABD'))
+
+    def test_kahns_streams_before_cycle_is_found(self):
+        graph = {'start': ['A'], 'A': ['B'], 'B': ['A']}
+        order = kahns_topological_sort(graph)
+        self.assertEqual(next(order), 'start')
+        self.assertRaises(CycleError, next, order)
+
+    def test_long_chain(self):
+        graph = {i: [i + 1] for i in range(10 ** 5)}
+        self.assertEqual(topological_sort(graph), list(range(10 ** 5 + 1)))
+
+    def test_incremental_order(self):
+        rng = random.Random(1)
+        graph, _ = random_dag(200, 400)
+        order = IncrementalTopologicalOrder(graph)
+        self.assert_topological_order(graph, order.order)
+        for _ in range(500):
+            u, v = rng.sample(range(200), 2)
+            try:
+                order.add_edge(u, v)
+            except CycleError as error:
+                self.assertEqual(error.cycle[:2], [u, v])
+                self.assertEqual(error.cycle[-1], u)
+                for a, b in zip(error.cycle[1:-1], error.cycle[2:]):
+                    self.assertIn(b, graph[a])
+            else:
+                graph[u].add(v)
+            self.assert_topological_order(graph, order.order)
+            self.assertEqual(
+                [order.position[vertex] for vertex in order.order],
+                list(range(len(order))))
+
+    def test_incremental_order_adds_vertices(self):
+        order = IncrementalTopologicalOrder()
+        order.add_edge('b', 'c')
+        order.add_edge('a', 'b')
+        order.add_edge('c', 'd')
+        self.assertEqual(list(order), ['a', 'b', 'c', 'd'])
+        self.assertRaises(CycleError, order.add_edge, 'd', 'a')
+        self.assertRaises(CycleError, order.add_edge, 'd', 'd')
+        order.remove_edge('c', 'd')
+        order.add_edge('d', 'a')
+        self.assertEqual(list(order), ['d', 'a', 'b', 'c'])
+
+
+if __name__ == '__main__':
+    unittest.main()
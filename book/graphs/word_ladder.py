@@ -88,6 +88,7 @@ vertices that can be reached by changing one letter in that word.
 
 from collections import defaultdict
 from itertools import product
+import hashlib
 import os
 
 
@@ -116,11 +117,92 @@ def get_words(vocabulary_file):
 
 
 vocabulary_file = os.path.join(os.path.dirname(__file__), 'vocabulary.txt')
-word_graph = build_graph(get_words(vocabulary_file))
 
-# word_graph['FOOL']
+# build_graph(get_words(vocabulary_file))['FOOL']
 # set(['POOL', 'WOOL', 'FOWL', 'FOAL', 'FOUL', ... ])
 
+"""
+Building the graph takes a noticeable amount of time, which we would
+rather not spend every time this module is imported, especially by a
+program which never uses the graph. So rather than building `word_graph`
+straight away, we wrap the function that builds it in a `LazyGraph`,
+which behaves like the graph itself but only calls the function the first
+time it is used, and keeps the result for subsequent uses. Since it is a
+`Mapping`, it supports `get`, `items`, `keys` and the rest just as the
+graph does.
+
+A program which runs many times, each time in a fresh process, would
+still rebuild the graph on every run. To avoid this, `load_word_graph`
+can be given a directory in which to save the graph the first time it is
+built, in the compact file format described in the section on
+representing a graph. The name of the file includes a hash of the
+vocabulary file’s path, size and modification time, so the graph is
+rebuilt whenever the vocabulary file changes; otherwise later runs
+simply map the saved file into memory.
+"""
+
+try:
+    from collections.abc import Mapping
+except ImportError:  # Python 2
+    from collections import Mapping
+
+from graph_file import open_graph, write_graph
+
+
+class LazyGraph(Mapping):
+    def __init__(self, load):
+        self.load = load
+        self._graph = None
+
+    @property
+    def graph(self):
+        if self._graph is None:
+            self._graph = self.load()
+        return self._graph
+
+    def __getitem__(self, vertex):
+        return self.graph[vertex]
+
+    def __iter__(self):
+        return iter(self.graph)
+
+    def __len__(self):
+        return len(self.graph)
+
+    def __contains__(self, vertex):
+        return vertex in self.graph
+
+    def get(self, vertex, default=None):
+        # the built graph may be a defaultdict, so check before indexing
+        return self.graph[vertex] if vertex in self.graph else default
+
+
+def load_word_graph(vocabulary_file=vocabulary_file, cache_directory=None):
+    if cache_directory is None:
+        return build_graph(get_words(vocabulary_file))
+
+    stat = os.stat(vocabulary_file)
+    key = hashlib.sha1('{}:{}:{}'.format(
+        os.path.abspath(vocabulary_file), stat.st_size, stat.st_mtime
+    ).encode('utf-8')).hexdigest()
+    cache_file = os.path.join(cache_directory, 'word_graph-{}.bin'.format(key))
+    if not os.path.exists(cache_file):
+        # write to a temporary file first, so that concurrent processes
+        # never see a partially written graph
+        temporary_file = '{}.{}.tmp'.format(cache_file, os.getpid())
+        try:
+            write_graph(build_graph(get_words(vocabulary_file)),
+                        temporary_file)
+            os.rename(temporary_file, cache_file)
+        except BaseException:
+            if os.path.exists(temporary_file):
+                os.remove(temporary_file)
+            raise
+    return open_graph(cache_file)
+
+
+word_graph = LazyGraph(load_word_graph)
+
 
 """
 Since this is our first real-world graph problem, you might be wondering
@@ -263,3 +345,232 @@ Finally, at least for this problem, there is the time required to build
 the initial graph. We leave the analysis of the `build_graph` function as
 an exercise for you.
 """
+
+"""
+Remembering Predecessors Instead of Paths
+---
+
+Our `traverse` function is convenient, since it hands us the complete
+path to every vertex as it goes, but it pays for that convenience by
+copying a path for every vertex it discovers. The deeper the search, the
+longer the paths, and the more time and memory is spent copying them.
+
+Instead, we can record just the vertex from which each vertex was first
+reached, in a `predecessors` dictionary which also takes the place of our
+`visited` set. The path to any vertex can then be recovered when it is
+needed by following the predecessor links back to the start. If we are
+searching for a particular `goal`, we can also stop as soon as we find
+it.
+"""
+
+
+def breadth_first_tree(graph, starting_vertex, goal=None):
+    predecessors = {starting_vertex: None}
+    queue = deque([starting_vertex])
+    while queue:
+        vertex = queue.popleft()
+        for neighbor in graph[vertex]:
+            if neighbor not in predecessors:
+                predecessors[neighbor] = vertex
+                if neighbor == goal:
+                    return predecessors
+                queue.append(neighbor)
+    return predecessors
+
+
+def path_to(predecessors, vertex):
+    if vertex not in predecessors:
+        return None
+    path = []
+    while vertex is not None:
+        path.append(vertex)
+        vertex = predecessors[vertex]
+    path.reverse()
+    return path
+
+# path_to(breadth_first_tree(word_graph, 'FOOL', 'SAGE'), 'SAGE')
+# => ['FOOL', 'FOOD', 'FOLD', 'SOLD', 'SOLE', 'SALE', 'SAGE']
+
+"""
+When we know both the start and the goal, we can search from both ends
+at once. Each search expands a whole level of its breadth first tree at
+a time, and we always expand whichever search has the smaller frontier.
+As soon as one search reaches a vertex already reached by the other, the
+two halves join up into a shortest path. Since the number of vertices at
+each level tends to grow rapidly, two searches of half the depth usually
+explore far fewer vertices than one search of the full depth.
+
+This relies on the word ladder graph being undirected, so that the
+backward search can follow the same edges as the forward one.
+"""
+
+
+def bidirectional_search(graph, starting_vertex, goal):
+    if starting_vertex == goal:
+        return [starting_vertex]
+
+    forward_predecessors = {starting_vertex: None}
+    backward_predecessors = {goal: None}
+    forward_frontier = [starting_vertex]
+    backward_frontier = [goal]
+
+    while forward_frontier and backward_frontier:
+        if len(forward_frontier) <= len(backward_frontier):
+            forward_frontier, meeting = expand_level(
+                graph, forward_frontier,
+                forward_predecessors, backward_predecessors)
+        else:
+            backward_frontier, meeting = expand_level(
+                graph, backward_frontier,
+                backward_predecessors, forward_predecessors)
+            if meeting is not None:
+                meeting = tuple(reversed(meeting))
+
+        if meeting is not None:
+            forward_vertex, backward_vertex = meeting
+            path = path_to(forward_predecessors, forward_vertex)
+            path.extend(reversed(path_to(
+                backward_predecessors, backward_vertex)))
+            return path
+
+    return None
+
+
+def expand_level(graph, frontier, predecessors, other_predecessors):
+    next_frontier = []
+    for vertex in frontier:
+        for neighbor in graph[vertex]:
+            if neighbor in other_predecessors:
+                return next_frontier, (vertex, neighbor)
+            if neighbor not in predecessors:
+                predecessors[neighbor] = vertex
+                next_frontier.append(neighbor)
+    return next_frontier, None
+
+# bidirectional_search(word_graph, 'FOOL', 'SAGE')
+# => ['FOOL', 'WOOL', 'WOOS', 'WOGS', 'WAGS', 'WAGE', 'SAGE']
+
+"""
+Keeping the Buckets
+---
+
+Our `build_graph` function adds an edge between every pair of words that
+share a bucket, so a bucket holding $$k$$ words costs $$O(k^2)$$ time to
+process, and the graph it produces holds each of those edges twice. With
+a larger vocabulary, or a smaller alphabet, buckets grow large and so
+does this cost.
+
+But the buckets themselves already tell us everything the edges do: the
+neighbors of a word are exactly the other words in the buckets that word
+belongs to. So instead of turning the buckets into edges, we can simply
+keep the buckets, and work out the neighbors of a word whenever they are
+asked for. Building a `BucketGraph` takes time proportional to the total
+length of the words, and it can be used in place of the graph from
+`build_graph` by any of our searches, since indexing it returns a set of
+neighbors just as before.
+"""
+
+
+def bucket_labels(word):
+    return [word[:i] + '_' + word[i + 1:] for i in range(len(word))]
+
+
+class BucketGraph(object):
+    def __init__(self, words):
+        self.words = set()
+        self.buckets = defaultdict(list)
+        for word in words:
+            self.words.add(word)
+            for bucket in bucket_labels(word):
+                self.buckets[bucket].append(word)
+
+    def __getitem__(self, word):
+        if word not in self.words:
+            raise KeyError(word)
+        neighbors = set()
+        for bucket in bucket_labels(word):
+            neighbors.update(self.buckets.get(bucket, ()))
+        neighbors.discard(word)
+        return neighbors
+
+    def __iter__(self):
+        return iter(self.words)
+
+    def __len__(self):
+        return len(self.words)
+
+    def __contains__(self, word):
+        return word in self.words
+
+# BucketGraph(get_words(vocabulary_file))['FOOL']
+# set(['POOL', 'WOOL', 'FOWL', 'FOAL', 'FOUL', ... ])
+
+"""
+Building the Graph in Parallel
+---
+
+For very large vocabularies we can share the work of `build_graph`
+between several processes. It is not enough to have each process find
+some of the edges and send them back, since the main process would then
+have to add every one of those edges to the graph itself, and that work
+alone would limit how much faster we could go. Instead we divide the
+*words* between the processes, and have each process work out the
+complete set of neighbors of each of its own words. All the main process
+has to do is put those sets into the graph as they arrive.
+
+To find the neighbors of any word, each process needs all of the
+buckets, which is exactly what a `BucketGraph` holds. We build one in
+the main process, which takes time proportional to the total length of
+the words, and give it to each process once, along with the sorted list
+of words, when it starts. From then on each task is simply a range of
+positions in that list, and the reply is a dictionary from each of those
+words to its neighbors. Words with no neighbors are left out, just as
+they are by `build_graph`.
+
+If a process fails, we terminate the pool straight away, rather than
+waiting for the remaining tasks to finish before the error is raised.
+"""
+
+from multiprocessing import Pool, cpu_count
+
+
+def build_graph_in_parallel(words, processes=None):
+    # a repeated word would otherwise be a neighbor of itself
+    words = sorted(set(words))
+    bucket_graph = BucketGraph(words)
+    chunk_size = len(words) // (4 * (processes or cpu_count())) + 1
+    tasks = [(start, min(start + chunk_size, len(words)))
+             for start in range(0, len(words), chunk_size)]
+
+    graph = defaultdict(set)
+    pool = Pool(processes, share_graph, (words, bucket_graph))
+    try:
+        for neighbors in pool.imap_unordered(find_neighbors, tasks):
+            graph.update(neighbors)
+    except BaseException:
+        pool.terminate()
+        raise
+    else:
+        pool.close()
+    finally:
+        pool.join()
+    return graph
+
+
+shared_graph = None
+
+
+def share_graph(words, graph):
+    global shared_graph
+    shared_graph = words, graph
+
+
+def find_neighbors(task):
+    start, end = task
+    words, graph = shared_graph
+    neighbors = {}
+    for word in words[start:end]:
+        word_neighbors = graph[word]
+        if word_neighbors:
+            neighbors[word] = word_neighbors
+    return neighbors
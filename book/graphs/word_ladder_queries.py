@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""
+A breadth first search from a starting word finds the shortest path from
+that word to *every* other word it can reach, so when we have many word
+ladder puzzles to solve there is no need to search again for each one.
+Instead we can group the puzzles by their starting word, search once from
+each starting word using `breadth_first_tree`, and read all of the paths
+we need out of the resulting tree of predecessors.
+
+Starting words also tend to recur from one batch of puzzles to the next,
+so `WordLadderQueries` keeps the trees from the most recently used
+starting words in a cache. An `OrderedDict` keeps the trees in order of
+use, so that when the cache is full we can discard the tree which has
+gone unused the longest. The `hits` and `misses` counters record how
+often a tree was found in the cache, which tells us whether the cache is
+large enough to be worth its memory.
+"""
+
+from collections import OrderedDict, defaultdict
+
+from word_ladder import breadth_first_tree, path_to
+
+
+class WordLadderQueries(object):
+    def __init__(self, graph, cache_size=128):
+        self.graph = graph
+        self.cache_size = cache_size
+        self.trees = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / float(lookups) if lookups else 0.0
+
+    def tree_from(self, starting_word):
+        if starting_word in self.trees:
+            self.hits += 1
+            # move the tree to the most recently used end of the cache
+            tree = self.trees.pop(starting_word)
+        else:
+            self.misses += 1
+            tree = breadth_first_tree(self.graph, starting_word)
+            if self.trees and len(self.trees) >= self.cache_size:
+                self.trees.popitem(last=False)
+        if self.cache_size > 0:
+            self.trees[starting_word] = tree
+        return tree
+
+    def shortest_paths(self, queries):
+        goals_by_start = defaultdict(list)
+        for starting_word, goal in queries:
+            goals_by_start[starting_word].append(goal)
+
+        paths = {}
+        for starting_word, goals in goals_by_start.items():
+            tree = self.tree_from(starting_word)
+            for goal in goals:
+                paths[starting_word, goal] = path_to(tree, goal)
+        return paths
+
+# queries = WordLadderQueries(word_graph)
+# queries.shortest_paths([('FOOL', 'SAGE'), ('FOOL', 'POLE')])
+# => {('FOOL', 'SAGE'): ['FOOL', 'FOOD', 'FOLD', 'SOLD', 'SOLE', 'SALE',
+#                         'SAGE'],
+#     ('FOOL', 'POLE'): ['FOOL', 'POOL', 'POLL', 'POLE']}
+# queries.hits, queries.misses  # => (0, 1)
@@ -0,0 +1,44 @@
+import unittest
+
+from word_ladder import breadth_first_tree, path_to, word_graph
+from word_ladder_queries import WordLadderQueries
+
+
+class TestCorrectness(unittest.TestCase):
+
+    def test_answers_batches_of_queries(self):
+        queries = WordLadderQueries(word_graph)
+        batch = [('FOOL', 'SAGE'), ('TREE', 'PEAR'), ('FOOL', 'POLE'),
+                 ('TREE', 'AAAA')]
+        paths = queries.shortest_paths(batch)
+        for start, goal in batch:
+            self.assertEqual(
+                paths[start, goal],
+                path_to(breadth_first_tree(word_graph, start), goal))
+        self.assertIsNone(paths['TREE', 'AAAA'])
+        self.assertEqual((queries.hits, queries.misses), (0, 2))
+
+        queries.shortest_paths([('FOOL', 'COOL'), ('COLD', 'WARM')])
+        self.assertEqual((queries.hits, queries.misses), (1, 3))
+        self.assertEqual(queries.hit_rate(), 0.25)
+
+    def test_evicts_least_recently_used_trees(self):
+        queries = WordLadderQueries(word_graph, cache_size=2)
+        for start in ('FOOL', 'TREE', 'FOOL', 'COLD'):
+            queries.tree_from(start)
+        self.assertEqual(list(queries.trees), ['FOOL', 'COLD'])
+        self.assertEqual((queries.hits, queries.misses), (1, 3))
+
+    def test_cache_can_be_disabled(self):
+        queries = WordLadderQueries(word_graph, cache_size=0)
+        paths = queries.shortest_paths([('FOOL', 'POLE'), ('TREE', 'PEAR')])
+        self.assertEqual(paths['FOOL', 'POLE'],
+                         path_to(breadth_first_tree(word_graph, 'FOOL'),
+                                 'POLE'))
+        queries.tree_from('FOOL')
+        self.assertEqual(len(queries.trees), 0)
+        self.assertEqual((queries.hits, queries.misses), (0, 3))
+
+
+if __name__ == '__main__':
+    unittest.main()
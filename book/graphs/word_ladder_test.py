@@ -1,6 +1,15 @@
+from collections import defaultdict
+import os
+import shutil
+import tempfile
 import unittest
 
-from word_ladder import traverse, word_graph
+import word_ladder
+from word_ladder import (
+    BucketGraph, LazyGraph, bidirectional_search, build_graph,
+    build_graph_in_parallel, get_words,
+    vocabulary_file, breadth_first_tree, load_word_graph,
+    path_to, traverse, word_graph)
 
 
 class TestCorrectness(unittest.TestCase):
@@ -20,6 +29,106 @@ class TestCorrectness(unittest.TestCase):
             'TREE', 'PREE', 'PREP', 'PEEP', 'PEER', 'PEAR'])
         self.assert_path_to_find_word('TREE', 'AAAA', None)
 
+    def test_finds_paths_with_predecessors(self):
+        predecessors = breadth_first_tree(word_graph, 'FOOL')
+        self.assertEqual(path_to(predecessors, 'SAGE'), [
+            'FOOL', 'FOOD', 'FOLD', 'SOLD', 'SOLE', 'SALE', 'SAGE'])
+        self.assertIsNone(path_to(predecessors, 'AAAA'))
+        for word, path in traverse(word_graph, 'FOOL'):
+            if word != 'FOOL':
+                self.assertEqual(len(path_to(predecessors, word)), len(path))
+
+        stopped_early = breadth_first_tree(word_graph, 'FOOL', 'FOOD')
+        self.assertLess(len(stopped_early), len(predecessors))
+        self.assertEqual(path_to(stopped_early, 'FOOD'), ['FOOL', 'FOOD'])
+
+    def test_bidirectional_search_finds_shortest_paths(self):
+        for start, goal in (('FOOL', 'SAGE'), ('TREE', 'PEAR'),
+                            ('COLD', 'WARM'), ('FOOL', 'FOOL')):
+            path = bidirectional_search(word_graph, start, goal)
+            expected = path_to(breadth_first_tree(word_graph, start), goal)
+            self.assertEqual(len(path), len(expected))
+            self.assertEqual((path[0], path[-1]), (start, goal))
+            for word1, word2 in zip(path[:-1], path[1:]):
+                self.assertIn(word2, word_graph[word1])
+        disconnected_graph = {
+            'A': set(['B']), 'B': set(['A']), 'C': set(['D']), 'D': set(['C'])}
+        self.assertIsNone(bidirectional_search(disconnected_graph, 'A', 'D'))
+
+    def test_bucket_graph_matches_built_graph(self):
+        words = list(get_words(vocabulary_file))
+        bucket_graph = BucketGraph(words)
+        built_graph = build_graph(words)
+        self.assertEqual(len(bucket_graph), len(words))
+        self.assertIn('FOOL', bucket_graph)
+        self.assertNotIn('AAAA', bucket_graph)
+        self.assertRaises(KeyError, bucket_graph.__getitem__, 'FOOX')
+        for word in words:
+            self.assertEqual(bucket_graph[word], built_graph.get(word, set()))
+        self.assertEqual(
+            len(path_to(breadth_first_tree(bucket_graph, 'FOOL'), 'SAGE')),
+            len(path_to(breadth_first_tree(built_graph, 'FOOL'), 'SAGE')))
+
+    def test_parallel_build_matches_build_graph(self):
+        words = list(get_words(vocabulary_file))
+        words += ['A', 'I', 'AT', 'IT', 'TOOLS', 'POOLS', 'POLLS']
+        self.assertEqual(
+            build_graph_in_parallel(words, processes=2), build_graph(words))
+
+    def test_parallel_build_ignores_repeated_words(self):
+        graph = build_graph_in_parallel(['FOOL', 'POOL', 'FOOL'], processes=1)
+        self.assertEqual(graph, {'FOOL': set(['POOL']),
+                                 'POOL': set(['FOOL'])})
+
+    def test_builds_graph_lazily_once(self):
+        calls = []
+
+        def load():
+            calls.append(True)
+            return {'A': set(['B']), 'B': set(['A'])}
+
+        graph = LazyGraph(load)
+        self.assertEqual(calls, [])
+        self.assertEqual(graph['A'], set(['B']))
+        self.assertEqual(sorted(graph), ['A', 'B'])
+        self.assertEqual(len(calls), 1)
+
+    def test_lazy_graph_is_a_mapping(self):
+        graph = LazyGraph(lambda: defaultdict(set, {'A': set(['B'])}))
+        self.assertEqual(graph.get('A'), set(['B']))
+        self.assertIsNone(graph.get('Z'))
+        self.assertEqual(list(graph.keys()), ['A'])
+        self.assertEqual(list(graph.items()), [('A', set(['B']))])
+        self.assertEqual(len(graph), 1)
+        self.assertNotIn('Z', graph)
+
+    def test_removes_partial_cache_file_on_failure(self):
+        cache_directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_directory)
+
+        def write_part_of_graph(graph, path):
+            with open(path, 'w') as graph_file:
+                graph_file.write('CSRG')
+            raise IOError('disk full')
+
+        self.addCleanup(setattr, word_ladder, 'write_graph',
+                        word_ladder.write_graph)
+        word_ladder.write_graph = write_part_of_graph
+        self.assertRaises(IOError, load_word_graph,
+                          cache_directory=cache_directory)
+        self.assertEqual(os.listdir(cache_directory), [])
+
+    def test_loads_graph_from_cache_directory(self):
+        cache_directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_directory)
+        built = load_word_graph(cache_directory=cache_directory)
+        cached = load_word_graph(cache_directory=cache_directory)
+        self.addCleanup(built.close)
+        self.addCleanup(cached.close)
+        self.assertEqual(len(cached), len(word_graph))
+        for word in ('FOOL', 'SAGE', 'TREE'):
+            self.assertEqual(set(cached[word]), word_graph[word])
+
 
 if __name__ == '__main__':
     unittest.main()